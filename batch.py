@@ -8,6 +8,8 @@ def main():
     parser.add_argument("input_folder", help="Input folder containing images/PDFs")
     parser.add_argument("output_folder", help="Output folder for results")
     parser.add_argument("--config", default="config.json", help="Configuration file path")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Number of worker processes (default: 1, process files in this process)")
 
     args = parser.parse_args()
 
@@ -18,7 +20,7 @@ def main():
     ocr_config = OCRConfig(**config_data['ocr'])
     extraction_config = ExtractionConfig(**config_data['extraction'])
 
-    process_batch(args.input_folder, args.output_folder, ocr_config, extraction_config)
+    process_batch(args.input_folder, args.output_folder, ocr_config, extraction_config, workers=args.workers)
     print(f"Batch processing completed. Results saved to {args.output_folder}")
 
 if __name__ == "__main__":
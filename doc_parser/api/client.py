@@ -48,10 +48,15 @@ class DocumentParserClient:
         ocr_config = OCRConfig(**config_data['ocr'])
         extraction_config = ExtractionConfig(**config_data['extraction'])
         validation_config = ValidationConfig(**config_data.get('validation', {}))
-        processor_config = DocumentProcessorConfig(ocr=ocr_config, extraction=extraction_config, validation=validation_config)
+        processor_config = DocumentProcessorConfig(ocr=ocr_config, extraction=extraction_config, validation=validation_config,
+                                                   page_workers=config_data.get('page_workers', 1))
 
         self.processor = DocumentProcessor(processor_config)
 
+    def close(self):
+        """Release processor resources (the page OCR worker pool, if started)"""
+        self.processor.close()
+
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
         return {
@@ -99,7 +104,7 @@ class DocumentParserClient:
             Structured result dictionary
         """
         result = self.processor.process_file(str(file_path))
-        return result.dict()
+        return result.model_dump()
 
     def process_files(self, file_paths: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
@@ -113,7 +118,7 @@ class DocumentParserClient:
         """
         paths = [str(p) for p in file_paths]
         results = self.processor.process_files_batch(paths)
-        return [r.dict() for r in results]
+        return [r.model_dump() for r in results]
 
     def process_directory(self, input_dir: Union[str, Path], output_dir: Union[str, Path] = None,
                          extensions: List[str] = None) -> List[Dict[str, Any]]:
@@ -159,14 +164,14 @@ class DocumentParserClient:
         Returns:
             Extracted text
         """
-        images = self.processor._load_images(str(file_path))
-        all_text = ""
+        if Path(file_path).suffix.lower() == '.pdf':
+            # Text-native pages are read from the PDF's text layer, only the others are rasterized and OCR'd
+            return self.processor._recognize_pdf(str(file_path))['text']
 
-        for img_path in images:
-            ocr_result = self.processor.ocr_engine.recognize(img_path)
-            all_text += ocr_result['text'] + "\n"
+        images = self.processor._load_images(str(file_path))
+        page_texts = [result['text'] for result in self.processor.ocr_engine.recognize_batch(images)]
 
-        return all_text.strip()
+        return '\n'.join(page_texts).strip()
 
     def update_config(self, ocr_config: Dict[str, Any] = None, extraction_config: Dict[str, Any] = None, validation_config: Dict[str, Any] = None):
         """
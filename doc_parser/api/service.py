@@ -25,6 +25,12 @@ app = FastAPI(
 client = DocumentParserClient()
 
 
+@app.on_event("shutdown")
+def shutdown_client():
+    """Stop the client's page OCR worker pool with the service"""
+    client.close()
+
+
 @app.post("/process/file", summary="Process single file")
 async def process_file(
     file: UploadFile = File(...),
@@ -0,0 +1,28 @@
+"""
+Numba kernels for image preprocessing
+Imported lazily on first use, so numba's import and JIT cache loading are only paid by deskew
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from .ocr import MAX_DESKEW_ANGLE
+
+
+# Explicit signature for cv2.HoughLinesP's int32 output: compiled (or loaded from numba's disk
+# cache) when this module is imported, instead of on the first call
+@njit('float64(int32[:, :])', parallel=True, cache=True)
+def median_angle(lines):
+    """Median skew angle (degrees) of (N, 4) x1/y1/x2/y2 segments within MAX_DESKEW_ANGLE, 0.0 if none"""
+    n = lines.shape[0]
+    angles = np.empty(n, dtype=np.float64)
+    keep = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        angle = np.arctan2(lines[i, 3] - lines[i, 1], lines[i, 2] - lines[i, 0]) * 180.0 / np.pi
+        angle = (angle + 90.0) % 180.0 - 90.0
+        angles[i] = angle
+        keep[i] = abs(angle) < MAX_DESKEW_ANGLE
+    selected = angles[keep]
+    if selected.size == 0:
+        return 0.0
+    return np.median(selected)
@@ -0,0 +1,39 @@
+"""
+Baidu OCR client
+One shared AipOcr client per set of credentials, for the OCR engine and the setup script
+"""
+
+import functools
+
+BAIDU_POOL_SIZE = 4  # Keep-alive connections kept per client
+BAIDU_MAX_RETRIES = 3  # Retries on connection errors, with exponential backoff
+
+
+@functools.lru_cache(maxsize=4)
+def get_baidu_client(app_id: str, api_key: str, secret_key: str):
+    """
+    Get (or lazily create) a shared Baidu OCR client
+
+    Args:
+        app_id: Baidu application ID
+        api_key: Baidu API key
+        secret_key: Baidu secret key
+
+    Returns:
+        aip.AipOcr whose HTTP session pools and retries connections
+    """
+    from aip import AipOcr
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    client = AipOcr(app_id, api_key, secret_key)
+
+    # AipOcr posts through its own requests.Session (client.s): give it a sized connection pool and
+    # retries, so the TLS handshake is paid once and transient connection failures don't fail the page
+    session = getattr(client, 's', None)
+    if session is not None:
+        adapter = HTTPAdapter(pool_connections=BAIDU_POOL_SIZE, pool_maxsize=BAIDU_POOL_SIZE,
+                              max_retries=Retry(total=BAIDU_MAX_RETRIES, backoff_factor=0.3))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    return client
@@ -4,8 +4,127 @@ Entity extraction based on rules and NLP
 """
 
 from typing import Dict, Any, List, Optional, Union
+import functools
 import re
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+# Built-in patterns applied to every document, compiled once at import
+_RE_LEADING_SEPARATORS = re.compile(r'^[:：\s\-=\n\r\t]+')
+_RE_SEGMENT_BREAK = re.compile(r'[。！？\n\r]')
+_RE_SENTENCE_BREAK = re.compile(r'[。！？]')
+_RE_DIGIT = re.compile(r'\d')
+_RE_CURRENCY_SYMBOLS = re.compile(r'[￥$€£¥]')
+_RE_AMOUNT_SEPARATORS = re.compile(r'[,\s]')
+_RE_BULLET_LINE = re.compile(r'^[-•*]\s')
+_RE_NUMBERED_LINE = re.compile(r'^\d+[\.)]\s')
+_RE_NUMBERED_ITEM = re.compile(r'^(\d+)[\.)]\s*(.+)')
+
+# Value patterns by value_type hint
+_AMOUNT_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'([\d,]+(?:\.\d{2})?)',  # Basic numbers
+    r'RMB\s*([\d,]+(?:\.\d{2})?)',
+    r'\$\s*([\d,]+(?:\.\d{2})?)',
+    r'￥\s*([\d,]+(?:\.\d{2})?)',
+)]
+_DATE_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'(\d{4}年\d{1,2}月\d{1,2}日)',  # Chinese
+    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
+    r'(\d{4}-\d{1,2}-\d{1,2})',  # YYYY-MM-DD
+    r'([A-Z][a-z]+ \d{1,2}, \d{4})',  # English
+)]
+_PLATE_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'\b([A-Z0-9]{6,8})\b',  # General alphanumeric
+    r'\b([京津沪渝冀豫云辽黑湘皖鲁新苏浙赣鄂桂甘晋蒙陕吉闽贵粤青藏川宁琼使领][A-Z][A-Z0-9]{5})\b',  # Chinese
+)]
+_NAME_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # English names
+    r'([A-Z][a-z]+)',  # Single English name
+    r'([\u4e00-\u9fff]{2,10})',  # Chinese names
+)]
+_COMPANY_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'([A-Z][a-zA-Z\s]*(?:Inc|Corp|Ltd|LLC|Company|Corporation|有限公司|公司))',
+    r'([\u4e00-\u9fff]{2,20}(?:有限公司|公司|集团|企业))',  # Chinese companies
+)]
+_PHONE_VALUE_PATTERNS = [re.compile(p) for p in (
+    r'(\d{3,4}[-]\d{7,8})',  # Chinese phone
+    r'(\+?\d{1,3}[-]?\d{3,4}[-]?\d{4,})',  # International
+    r'(\d{10,11})',  # 10-11 digit numbers
+)]
+
+# Adaptive key-value patterns
+_KVP_AMOUNT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'gross base salary of RMB\s*([\d,]+)',  # Specific pattern for this document
+    r'RMB\s*([\d,]+(?:\.\d{2})?)',  # RMB amounts
+    r'\$([\\d,]+(?:\\.\d{2})?)',  # USD amounts
+    r'￥([\\d,]+(?:\\.\d{2})?)',  # CNY amounts
+)]
+_KVP_COMPANY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'([A-Z][a-zA-Z\s]+(?:Inc|Corp|Ltd|LLC|Company|Corporation))\.?',
+    r'Croschat\s+Inc',  # Specific for this document
+)]
+_KVP_DATE_PATTERNS = [re.compile(p) for p in (
+    r'(\d{4}年\d{1,2}月\d{1,2}日)',  # Chinese dates
+    r'([A-Z][a-z]+ \d{1,2}, \d{4})',  # English dates like "March 22, 2025"
+    r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
+    r'(\d{4}-\d{1,2}-\d{1,2})',  # YYYY-MM-DD
+)]
+_KVP_NAME_PATTERNS = [re.compile(p) for p in (
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # English names
+    r'Dear\s+([A-Z][a-z]+)',  # "Dear [Name]" pattern
+)]
+_KVP_LICENSE_PLATE_PATTERNS = [re.compile(p) for p in (
+    # Chinese license plates: 省份缩写 + 5位字母数字
+    r'\b([京津沪渝冀豫云辽黑湘皖鲁新苏浙赣鄂桂甘晋蒙陕吉闽贵粤青藏川宁琼使领][A-Z][A-Z0-9]{5})\b',
+    # International license plates: various formats
+    r'\b([A-Z]{1,3}[0-9]{1,4}[A-Z0-9]{0,3})\b',  # General alphanumeric
+    r'\b([0-9]{1,4}[A-Z]{1,3}[0-9]{0,4})\b',  # Numbers + letters
+    # Common license plate lengths (6-8 characters)
+    r'\b([A-Z0-9]{6,8})\b',
+)]
+
+# Numbered section patterns (一、二、三... and 1. 2. 3...)
+_CHINESE_SECTION_PATTERNS = [
+    (num, re.compile(re.escape(num) + r'(.*?)(?=\n|$)', re.DOTALL))
+    for num in ['一、', '二、', '三、', '四、', '五、', '六、', '七、', '八、', '九、', '十、']
+]
+_STEP_PATTERNS = [(i, re.compile(rf'{i}[\.)]\s*(.*?)(?=\n|$)', re.DOTALL)) for i in range(1, 10)]
+
+# Date normalization patterns: YYYY-MM-DD or YYYY年MM月DD日, MM/DD/YYYY, YYYY/MM/DD
+_DATE_NORMALIZE_PATTERNS = [re.compile(p) for p in (
+    r'(\d{4})[-年](\d{1,2})[-月](\d{1,2})日?',
+    r'(\d{1,2})/(\d{1,2})/(\d{4})',
+    r'(\d{4})/(\d{1,2})/(\d{1,2})',
+)]
+
+
+# Pipes the extractor never uses (entities and POS tags need tok2vec, tagger, attribute_ruler and ner)
+SPACY_DISABLED_PIPES = ["parser", "lemmatizer"]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_spacy(model_name: str):
+    """Load a spaCy pipeline once per process; every extractor shares it"""
+    import spacy
+    return spacy.load(model_name, disable=SPACY_DISABLED_PIPES)
+
+
+def _compile_regex_patterns(regex_patterns: Optional[List[str]]) -> List[re.Pattern]:
+    """Compile regex patterns (case-insensitive), skipping invalid ones"""
+    compiled = []
+    for regex_pattern in regex_patterns or []:
+        try:
+            compiled.append(re.compile(regex_pattern, re.IGNORECASE))
+        except re.error as e:
+            print(f"Regex error for pattern '{regex_pattern}': {e}")
+    return compiled
+
+
+def _normalize_keywords(pattern: Union[str, List[str], None]) -> List[str]:
+    """Lowercased, stripped keywords of a field pattern, in configured order (empty keywords are dropped)"""
+    patterns = [pattern] if isinstance(pattern, str) else pattern
+    keywords = (keyword.lower().strip() for keyword in patterns or [])
+    return [keyword for keyword in keywords if keyword]
 
 
 class FieldRule(BaseModel):
@@ -18,6 +137,24 @@ class FieldRule(BaseModel):
     value_type: Optional[str] = Field(default=None, description="Value type hint for intelligent extraction")
     post_process: Optional[str] = Field(default=None, description="Post-processing function name")
 
+    # regex_patterns compiled and keywords normalized once when the rule is loaded, not per document
+    _compiled_regexes: List[re.Pattern] = PrivateAttr(default_factory=list)
+    _keywords: List[str] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._compiled_regexes = _compile_regex_patterns(self.regex_patterns)
+        self._keywords = _normalize_keywords(self.pattern)
+
+    @property
+    def compiled_regexes(self) -> List[re.Pattern]:
+        """Compiled regex_patterns (invalid patterns are skipped)"""
+        return self._compiled_regexes
+
+    @property
+    def keywords(self) -> List[str]:
+        """Normalized keywords of pattern (lowercased, stripped, empty ones dropped)"""
+        return self._keywords
+
 
 class ExtractionConfig(BaseModel):
     """Extraction configuration"""
@@ -56,14 +193,14 @@ class StructuredExtractor:
 
         # Try Chinese model first (required for Chinese document processing)
         try:
-            self.nlp = spacy.load("zh_core_web_sm")
+            self.nlp = _load_spacy("zh_core_web_sm")
             print("✅ Loaded Chinese spaCy model (zh_core_web_sm)")
         except (ImportError, OSError) as e:
             print(f"❌ Chinese spaCy model not found: {e}")
             print("Please install with: python -m spacy download zh_core_web_sm")
             try:
                 # Fallback to English model
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = _load_spacy("en_core_web_sm")
                 print("⚠️  Using English spaCy model (en_core_web_sm) as fallback")
                 print("For better Chinese processing, install: python -m spacy download zh_core_web_sm")
             except (ImportError, OSError) as e2:
@@ -86,10 +223,12 @@ class StructuredExtractor:
             List of extracted fields
         """
         extracted = []
+        # Lowercase once for the keyword search of every field
+        text_lower = text.lower()
 
         # First, try configured fields
         for field in self.config.fields:
-            value, confidence, bbox = self._extract_field(field, text, ocr_result)
+            value, confidence, bbox = self._extract_field(field, text, ocr_result, text_lower)
             extracted.append(ExtractedField(
                 name=field.name,
                 value=value,
@@ -104,36 +243,32 @@ class StructuredExtractor:
 
         return extracted
 
-    def _extract_field(self, field: FieldRule, text: str, ocr_result: Dict[str, Any]) -> tuple:
+    def _extract_field(self, field: FieldRule, text: str, ocr_result: Dict[str, Any],
+                       text_lower: Optional[str] = None) -> tuple:
         """Extract single field using simplified key-based approach"""
+        keywords = field.keywords
+
         # Try regex patterns first (highest priority - for advanced users)
-        if field.regex_patterns:
-            for regex_pattern in field.regex_patterns:
-                try:
-                    match = re.search(regex_pattern, text, re.IGNORECASE)
-                    if match:
-                        value = match.group(1) if match.groups() else match.group(0)
-                        value = self._clean_extracted_value(value)
-
-                        # Apply post-processing if specified
-                        if field.post_process:
-                            value = self._apply_post_process(field.post_process, value)
-
-                        confidence = 90.0  # Higher confidence for regex matches
-                        bbox = None
-                        return value, confidence, bbox
-                except re.error as e:
-                    print(f"Regex error for pattern '{regex_pattern}': {e}")
-                    continue
+        for regex in field.compiled_regexes:
+            match = regex.search(text)
+            if match:
+                value = match.group(1) if match.groups() else match.group(0)
+                value = self._clean_extracted_value(value)
+
+                # Apply post-processing if specified
+                if field.post_process:
+                    value = self._apply_post_process(field.post_process, value)
+
+                confidence = 90.0  # Higher confidence for regex matches
+                bbox = None
+                return value, confidence, bbox
 
         # Try simplified key-based extraction (main approach for users)
-        if field.pattern:
-            patterns = [field.pattern] if isinstance(field.pattern, str) else field.pattern
-            for keyword in patterns:
-                # Look for the keyword in the text (case-insensitive)
-                keyword_lower = keyword.lower().strip()
+        if keywords:
+            if text_lower is None:
                 text_lower = text.lower()
-
+            for keyword_lower in keywords:
+                # Look for the keyword in the text (case-insensitive)
                 if keyword_lower in text_lower:
                     # Find all occurrences of the keyword
                     start_positions = []
@@ -186,12 +321,12 @@ class StructuredExtractor:
         candidate_text = candidate_text.strip()
 
         # Remove common separators and punctuation at the beginning
-        candidate_text = re.sub(r'^[:：\s\-=\n\r\t]+', '', candidate_text)
+        candidate_text = _RE_LEADING_SEPARATORS.sub('', candidate_text)
 
         if not value_type:
             # No type hint - extract first meaningful segment
             # Look for natural breaks (punctuation, line breaks, etc.)
-            segments = re.split(r'[。！？\n\r]', candidate_text)
+            segments = _RE_SEGMENT_BREAK.split(candidate_text)
             for segment in segments:
                 segment = segment.strip()
                 if segment and len(segment) > 1 and len(segment) < 50:
@@ -201,38 +336,22 @@ class StructuredExtractor:
 
         elif value_type == "金额" or value_type == "amount":
             # Extract amounts
-            amount_patterns = [
-                r'([\d,]+(?:\.\d{2})?)',  # Basic numbers
-                r'RMB\s*([\d,]+(?:\.\d{2})?)',
-                r'\$\s*([\d,]+(?:\.\d{2})?)',
-                r'￥\s*([\d,]+(?:\.\d{2})?)',
-            ]
-            for pattern in amount_patterns:
-                match = re.search(pattern, candidate_text)
+            for pattern in _AMOUNT_VALUE_PATTERNS:
+                match = pattern.search(candidate_text)
                 if match:
                     return match.group(1)
 
         elif value_type == "日期" or value_type == "date":
             # Extract dates
-            date_patterns = [
-                r'(\d{4}年\d{1,2}月\d{1,2}日)',  # Chinese
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-                r'(\d{4}-\d{1,2}-\d{1,2})',  # YYYY-MM-DD
-                r'([A-Z][a-z]+ \d{1,2}, \d{4})',  # English
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, candidate_text)
+            for pattern in _DATE_VALUE_PATTERNS:
+                match = pattern.search(candidate_text)
                 if match:
                     return match.group(1)
 
         elif value_type == "车牌" or value_type == "license":
             # Extract license plates
-            plate_patterns = [
-                r'\b([A-Z0-9]{6,8})\b',  # General alphanumeric
-                r'\b([京津沪渝冀豫云辽黑湘皖鲁新苏浙赣鄂桂甘晋蒙陕吉闽贵粤青藏川宁琼使领][A-Z][A-Z0-9]{5})\b',  # Chinese
-            ]
-            for pattern in plate_patterns:
-                match = re.search(pattern, candidate_text.upper())
+            for pattern in _PLATE_VALUE_PATTERNS:
+                match = pattern.search(candidate_text.upper())
                 if match:
                     plate = match.group(1)
                     # Validate license plate
@@ -243,30 +362,21 @@ class StructuredExtractor:
 
         elif value_type == "姓名" or value_type == "name":
             # Extract names
-            name_patterns = [
-                r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # English names
-                r'([A-Z][a-z]+)',  # Single English name
-                r'([\u4e00-\u9fff]{2,10})',  # Chinese names
-            ]
-            for pattern in name_patterns:
-                match = re.search(pattern, candidate_text)
+            for pattern in _NAME_VALUE_PATTERNS:
+                match = pattern.search(candidate_text)
                 if match:
                     return match.group(1)
 
         elif value_type == "公司" or value_type == "company":
             # Extract company names
-            company_patterns = [
-                r'([A-Z][a-zA-Z\s]*(?:Inc|Corp|Ltd|LLC|Company|Corporation|有限公司|公司))',
-                r'([\u4e00-\u9fff]{2,20}(?:有限公司|公司|集团|企业))',  # Chinese companies
-            ]
-            for pattern in company_patterns:
-                match = re.search(pattern, candidate_text)
+            for pattern in _COMPANY_VALUE_PATTERNS:
+                match = pattern.search(candidate_text)
                 if match:
                     return match.group(1)
 
         elif value_type == "地址" or value_type == "address":
             # Extract addresses (look for longer text segments)
-            segments = re.split(r'[。！？\n\r]', candidate_text)
+            segments = _RE_SEGMENT_BREAK.split(candidate_text)
             for segment in segments:
                 segment = segment.strip()
                 if segment and len(segment) > 5 and len(segment) < 100:
@@ -274,18 +384,13 @@ class StructuredExtractor:
 
         elif value_type == "电话" or value_type == "phone":
             # Extract phone numbers
-            phone_patterns = [
-                r'(\d{3,4}[-]\d{7,8})',  # Chinese phone
-                r'(\+?\d{1,3}[-]?\d{3,4}[-]?\d{4,})',  # International
-                r'(\d{10,11})',  # 10-11 digit numbers
-            ]
-            for pattern in phone_patterns:
-                match = re.search(pattern, candidate_text)
+            for pattern in _PHONE_VALUE_PATTERNS:
+                match = pattern.search(candidate_text)
                 if match:
                     return match.group(1)
 
         # Default: extract first meaningful segment
-        segments = re.split(r'[。！？\n\r]', candidate_text)
+        segments = _RE_SEGMENT_BREAK.split(candidate_text)
         for segment in segments:
             segment = segment.strip()
             if segment and len(segment) > 1 and len(segment) < 50:
@@ -324,7 +429,7 @@ class StructuredExtractor:
         value = value.strip()
 
         # Check if this looks like a number (contains digits)
-        if re.search(r'\d', value):
+        if _RE_DIGIT.search(value):
             # For numeric strings, only remove trailing non-numeric chars
             # But keep internal punctuation that might be part of numbers
             # Include Chinese punctuation marks
@@ -367,8 +472,8 @@ class StructuredExtractor:
             return value
 
         # Remove currency symbols and extra spaces
-        value = re.sub(r'[￥$€£¥]', '', value)
-        value = re.sub(r'[,\s]', '', value)
+        value = _RE_CURRENCY_SYMBOLS.sub('', value)
+        value = _RE_AMOUNT_SEPARATORS.sub('', value)
 
         # Try to convert to float and format
         try:
@@ -398,15 +503,8 @@ class StructuredExtractor:
         # Focus on high-quality, specific patterns that are likely to be accurate
 
         # 1. Extract amounts with currency
-        amount_patterns = [
-            r'gross base salary of RMB\s*([\d,]+)',  # Specific pattern for this document
-            r'RMB\s*([\d,]+(?:\.\d{2})?)',  # RMB amounts
-            r'\$([\\d,]+(?:\\.\d{2})?)',  # USD amounts
-            r'￥([\\d,]+(?:\\.\d{2})?)',  # CNY amounts
-        ]
-
-        for pattern in amount_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _KVP_AMOUNT_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 value = match.strip()
                 if value and value != '0':
@@ -420,13 +518,8 @@ class StructuredExtractor:
                         ))
 
         # 2. Extract company names (look for Inc, Corp, Ltd patterns)
-        company_patterns = [
-            r'([A-Z][a-zA-Z\s]+(?:Inc|Corp|Ltd|LLC|Company|Corporation))\.?',
-            r'Croschat\s+Inc',  # Specific for this document
-        ]
-
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _KVP_COMPANY_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 value = match.strip()
                 if value and len(value) > 3:  # Avoid very short matches
@@ -440,15 +533,8 @@ class StructuredExtractor:
                         ))
 
         # 3. Extract dates (look for specific date formats)
-        date_patterns = [
-            r'(\d{4}年\d{1,2}月\d{1,2}日)',  # Chinese dates
-            r'([A-Z][a-z]+ \d{1,2}, \d{4})',  # English dates like "March 22, 2025"
-            r'(\d{1,2}/\d{1,2}/\d{4})',  # MM/DD/YYYY
-            r'(\d{4}-\d{1,2}-\d{1,2})',  # YYYY-MM-DD
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _KVP_DATE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 value = match.strip()
                 if value and len(value) > 5:  # Reasonable date length
@@ -462,13 +548,8 @@ class StructuredExtractor:
                         ))
 
         # 4. Extract person names (look for proper name patterns)
-        name_patterns = [
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # English names
-            r'Dear\s+([A-Z][a-z]+)',  # "Dear [Name]" pattern
-        ]
-
-        for pattern in name_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _KVP_NAME_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 value = match.strip()
                 if value and len(value) > 2:
@@ -482,18 +563,9 @@ class StructuredExtractor:
                         ))
 
         # 5. Extract license plates (Chinese and international formats)
-        license_plate_patterns = [
-            # Chinese license plates: 省份缩写 + 5位字母数字
-            r'\b([京津沪渝冀豫云辽黑湘皖鲁新苏浙赣鄂桂甘晋蒙陕吉闽贵粤青藏川宁琼使领][A-Z][A-Z0-9]{5})\b',
-            # International license plates: various formats
-            r'\b([A-Z]{1,3}[0-9]{1,4}[A-Z0-9]{0,3})\b',  # General alphanumeric
-            r'\b([0-9]{1,4}[A-Z]{1,3}[0-9]{0,4})\b',  # Numbers + letters
-            # Common license plate lengths (6-8 characters)
-            r'\b([A-Z0-9]{6,8})\b',
-        ]
-
-        for pattern in license_plate_patterns:
-            matches = re.findall(pattern, text.upper())  # Convert to uppercase for consistency
+        text_upper = text.upper()  # Convert to uppercase for consistency
+        for pattern in _KVP_LICENSE_PLATE_PATTERNS:
+            matches = pattern.findall(text_upper)
             for match in matches:
                 value = match.strip()
                 # Validate license plate characteristics
@@ -584,7 +656,7 @@ class StructuredExtractor:
             line = line.strip()
             if len(line) > 10 and len(line) < 100:  # Reasonable title length
                 # Check if it looks like a title (not starting with bullet points or numbers)
-                if not re.match(r'^[-•*]\s', line) and not re.match(r'^\d+[\.)]\s', line):
+                if not _RE_BULLET_LINE.match(line) and not _RE_NUMBERED_LINE.match(line):
                     # Check if it contains keywords suggesting it's a title
                     title_keywords = ['方法', '核心', '帮助', '需求', '转化', '代码', 'AI', '高效']
                     if any(keyword in line for keyword in title_keywords):
@@ -596,7 +668,7 @@ class StructuredExtractor:
                         )
 
         # Fallback: extract first meaningful sentence
-        sentences = re.split(r'[。！？]', text)
+        sentences = _RE_SENTENCE_BREAK.split(text)
         for sentence in sentences[:3]:
             sentence = sentence.strip()
             if len(sentence) > 20 and len(sentence) < 150:
@@ -614,10 +686,8 @@ class StructuredExtractor:
         sections = []
 
         # Look for numbered sections (like 一、二、三...)
-        chinese_numbers = ['一、', '二、', '三、', '四、', '五、', '六、', '七、', '八、', '九、', '十、']
-        for num in chinese_numbers:
-            pattern = re.escape(num) + r'(.*?)(?=\n|$)'
-            match = re.search(pattern, text, re.DOTALL)
+        for num, pattern in _CHINESE_SECTION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 section_content = match.group(1).strip()
                 if len(section_content) > 10:
@@ -633,9 +703,8 @@ class StructuredExtractor:
                         ))
 
         # Look for English numbered sections (1., 2., etc.)
-        for i in range(1, 10):
-            pattern = rf'{i}[\.)]\s*(.*?)(?=\n|$)'
-            match = re.search(pattern, text, re.DOTALL)
+        for i, pattern in _STEP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 section_content = match.group(1).strip()
                 if len(section_content) > 10:
@@ -708,7 +777,7 @@ class StructuredExtractor:
         for line in lines:
             line = line.strip()
             # Check if line starts with number
-            match = re.match(r'^(\d+)[\.)]\s*(.+)', line)
+            match = _RE_NUMBERED_ITEM.match(line)
             if match:
                 number = match.group(1)
                 content = match.group(2)
@@ -728,14 +797,8 @@ class StructuredExtractor:
             return value
 
         # Common date patterns
-        patterns = [
-            (r'(\d{4})[-年](\d{1,2})[-月](\d{1,2})日?', r'\1-\2-\3'),  # YYYY-MM-DD or YYYY年MM月DD日
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', r'\3-\1-\2'),  # MM/DD/YYYY -> YYYY-MM-DD
-            (r'(\d{4})/(\d{1,2})/(\d{1,2})', r'\1-\2-\3'),  # YYYY/MM/DD
-        ]
-
-        for pattern, replacement in patterns:
-            match = re.search(pattern, value)
+        for pattern in _DATE_NORMALIZE_PATTERNS:
+            match = pattern.search(value)
             if match:
                 try:
                     year, month, day = match.groups()
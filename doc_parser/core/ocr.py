@@ -13,11 +13,91 @@ except ImportError:
     CV2_AVAILABLE = False
     print("⚠️  OpenCV not available. Image preprocessing features will be limited.")
 
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+import functools
+import importlib.util
+import threading
+from io import BytesIO
 from PIL import Image
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 
+from .baidu_client import get_baidu_client
+from .vision_client import get_vision_client
+
+# numba is only imported (by _numba_kernels) when deskew first needs it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+MAX_DESKEW_ANGLE = 30.0  # Only consider angles within 30 degrees
+DESKEW_MAX_DIM = 1000  # Skew is estimated on a copy downscaled to at most this many pixels per side
+VISION_BATCH_SIZE = 16  # Max images per synchronous Google Vision batch_annotate_images request
+TESSERACT_BATCH_PAGES = 16  # Pages per multi-page TIFF in batched Tesseract CLI OCR
+# Tesseract language codes (OCRConfig.lang) to Google Vision language hints
+VISION_LANGUAGE_HINTS = {'chi_sim': 'zh', 'chi_tra': 'zh-Hant', 'eng': 'en', 'jpn': 'ja', 'kor': 'ko'}
+
+
+def _median_angle_numpy(lines):
+    """Median skew angle (degrees) of line segments given as an (N, 4) x1/y1/x2/y2 array"""
+    angles = np.degrees(np.arctan2(lines[:, 3] - lines[:, 1], lines[:, 2] - lines[:, 0]))
+    # Segment endpoints come in either order: fold directions into [-90, 90)
+    angles = (angles + 90.0) % 180.0 - 90.0
+    angles = angles[np.abs(angles) < MAX_DESKEW_ANGLE]
+    return float(np.median(angles)) if angles.size else 0.0
+
+
+def _extract_median_angle(lines) -> float:
+    """
+    Extract the median skew angle from cv2.HoughLinesP output
+
+    Args:
+        lines: Segment endpoint array of shape (N, 4), i.e. the ``lines[:, 0, :]`` view
+
+    Returns:
+        Median angle in degrees, or 0.0 if no line is within MAX_DESKEW_ANGLE
+    """
+    if NUMBA_AVAILABLE:
+        from ._numba_kernels import median_angle
+        return float(median_angle(np.asarray(lines, dtype=np.int32)))
+    return _median_angle_numpy(lines)
+
+
+# PaddleOCR models shared across OCREngine instances, keyed on (lang, use_angle_cls)
+_PADDLE_CLIENTS: Dict[Tuple[str, bool], Any] = {}
+
+
+def _get_paddle_client(lang: str = 'ch', use_angle_cls: bool = True):
+    """Get (or lazily load) a shared PaddleOCR model"""
+    key = (lang, use_angle_cls)
+    client = _PADDLE_CLIENTS.get(key)
+    if client is None:
+        from paddleocr import PaddleOCR
+        client = PaddleOCR(use_angle_cls=use_angle_cls, lang=lang, show_log=False)
+        _PADDLE_CLIENTS[key] = client
+    return client
+
+
+# Per-thread encode buffer reused by OCREngine._encode_image
+_ENCODE_BUFFER = threading.local()
+
+# Persistent Tesseract APIs (one loaded language model per lang), reused across calls in a process
+_TESSERACT_APIS: Dict[str, Any] = {}
+_TESSERACT_LOCK = threading.Lock()  # PyTessBaseAPI is not thread-safe
+
+
+def _get_tesseract_api(lang: str):
+    """Get (or lazily initialize) the persistent tesserocr API for a language"""
+    api = _TESSERACT_APIS.get(lang)
+    if api is None:
+        api = PyTessBaseAPI(lang=lang)
+        _TESSERACT_APIS[lang] = api
+    return api
+
 
 class OCRConfig(BaseModel):
     """OCR Configuration"""
@@ -36,35 +116,42 @@ class OCREngine:
 
     def __init__(self, config: OCRConfig):
         self.config = config
+        # Set when tesserocr cannot load the language data; OCR then goes through the pytesseract CLI
+        self._tesserocr_failed = False
         self._init_engine()
 
     def _init_engine(self):
         """Initialize OCR engine"""
         if self.config.engine == "google_vision":
             try:
-                from google.cloud import vision
-                import os
-                if self.config.google_credentials_path:
-                    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.config.google_credentials_path
-                self.client = vision.ImageAnnotatorClient()
+                self.client = get_vision_client(self.config.google_credentials_path)
             except ImportError:
                 raise ImportError("google-cloud-vision not installed. Install with: pip install google-cloud-vision")
         elif self.config.engine == "baidu_cloud":
             try:
-                from aip import AipOcr
                 if not all([self.config.baidu_app_id, self.config.baidu_api_key, self.config.baidu_secret_key]):
                     raise ValueError("Baidu OCR requires APP_ID, API_KEY, and SECRET_KEY")
-                self.client = AipOcr(self.config.baidu_app_id, self.config.baidu_api_key, self.config.baidu_secret_key)
+                self.client = get_baidu_client(self.config.baidu_app_id, self.config.baidu_api_key,
+                                               self.config.baidu_secret_key)
             except ImportError:
                 raise ImportError("baidu-aip not installed. Install with: pip install baidu-aip")
         elif self.config.engine == "paddle":
             try:
-                from paddleocr import PaddleOCR
-                # Initialize PaddleOCR with Chinese support
-                self.client = PaddleOCR(use_angle_cls=True, lang='ch', show_log=False)
+                # Initialize PaddleOCR with Chinese support (model is shared between engines)
+                self.client = _get_paddle_client(lang='ch', use_angle_cls=True)
             except ImportError:
                 raise ImportError("paddleocr not installed. Install with: pip install paddleocr")
         else:
+            if self._use_tesserocr():
+                # Load the language model now, once per process, instead of on every page
+                try:
+                    with _TESSERACT_LOCK:
+                        _get_tesseract_api(self.config.lang)
+                    return
+                except RuntimeError as e:
+                    # e.g. traineddata for lang missing from tesserocr's tessdata path
+                    print(f"⚠️  tesserocr could not load '{self.config.lang}': {e}. Falling back to the tesseract CLI.")
+                    self._tesserocr_failed = True
             try:
                 import pytesseract
                 # Set tesseract path (adjust according to system)
@@ -72,11 +159,19 @@ class OCREngine:
             except ImportError:
                 raise ImportError("pytesseract not installed. Install with: pip install pytesseract")
 
-    def _find_tesseract(self) -> str:
-        """Find tesseract executable"""
-        import platform
-        system = platform.system().lower()
+    def uses_tesseract_cli(self) -> bool:
+        """Whether OCR runs through the pytesseract CLI (one tesseract process per call)"""
+        return self.config.engine not in ("google_vision", "baidu_cloud", "paddle") and not self._use_tesserocr()
 
+    def _use_tesserocr(self) -> bool:
+        """Whether Tesseract runs in-process through tesserocr instead of the pytesseract CLI"""
+        # User word lists can only be loaded when the API is initialized, so keep them on the CLI path
+        return TESSEROCR_AVAILABLE and not self.config.custom_words and not self._tesserocr_failed
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_tesseract() -> str:
+        """Find tesseract executable (probed once per process)"""
         common_paths = [
             '/usr/local/bin/tesseract',
             '/usr/bin/tesseract',
@@ -96,26 +191,24 @@ class OCREngine:
             print("⚠️  OpenCV not available, skipping advanced preprocessing")
             return image
 
-        # Convert to OpenCV format
-        img = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
         if is_png:
-            # Enhanced preprocessing for PNG images
-            img = self._preprocess_png_image(img)
-        else:
-            # Standard preprocessing for PDFs/other formats
-            img = self._preprocess_standard_image(img)
-
-        return Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
-
-    def _preprocess_png_image(self, img):
+            # Enhanced preprocessing for PNG images (output is grayscale anyway)
+            return Image.fromarray(self._preprocess_png_image(self._to_gray_array(image)))
+
+        # Standard preprocessing for PDFs/other formats, in grayscale throughout (OCR only needs luminance)
+        return Image.fromarray(self._preprocess_standard_image(self._to_gray_array(image)))
+
+    @staticmethod
+    def _to_gray_array(image: Image.Image):
+        """Convert PIL image to a grayscale array in a single pass"""
+        if image.mode == 'L':
+            return np.asarray(image)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGB')
+        return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+
+    def _preprocess_png_image(self, gray):
         """Enhanced preprocessing specifically for PNG images"""
-        # Convert to grayscale if needed
-        if len(img.shape) == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img
-
         # Adaptive thresholding for better text extraction
         thresh = cv2.adaptiveThreshold(
             gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
@@ -131,7 +224,7 @@ class OCREngine:
         return processed
 
     def _preprocess_standard_image(self, img):
-        """Standard preprocessing for PDFs and other formats"""
+        """Standard preprocessing for PDFs and other formats (grayscale uint8 array in and out)"""
         # Noise reduction
         img = cv2.medianBlur(img, 3)
 
@@ -141,28 +234,26 @@ class OCREngine:
         return img
 
     def _deskew(self, img):
-        """Deskew image"""
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-        lines = cv2.HoughLines(edges, 1, np.pi/180, 200)
+        """Deskew a grayscale image"""
+        # Estimate the angle on a downscaled copy (angles are scale-invariant), rotate at full resolution
+        small = img
+        scale = DESKEW_MAX_DIM / max(img.shape)
+        if scale < 1:
+            small = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+        edges = cv2.Canny(small, 50, 150, apertureSize=3)
+        lines = cv2.HoughLinesP(edges, 1, np.pi/180, 100,
+                                minLineLength=small.shape[1] // 4, maxLineGap=20)
 
         if lines is not None:
-            angles = []
-            for line in lines:
-                rho, theta = line[0]
-                angle = theta * 180 / np.pi - 90
-                if abs(angle) < 30:  # Only consider angles within 30 degrees
-                    angles.append(angle)
-
-            if angles:
-                median_angle = np.median(angles)
-                if abs(median_angle) > 1:  # Only rotate if angle is significant
-                    (h, w) = img.shape[:2]
-                    center = (w // 2, h // 2)
-                    M = cv2.getRotationMatrix2D(center, median_angle, 1.0)
-                    img = cv2.warpAffine(img, M, (w, h),
-                                       flags=cv2.INTER_CUBIC,
-                                       borderMode=cv2.BORDER_REPLICATE)
+            median_angle = _extract_median_angle(lines[:, 0, :])
+            if abs(median_angle) > 1:  # Only rotate if angle is significant
+                (h, w) = img.shape[:2]
+                center = (w // 2, h // 2)
+                M = cv2.getRotationMatrix2D(center, median_angle, 1.0)
+                img = cv2.warpAffine(img, M, (w, h),
+                                   flags=cv2.INTER_CUBIC,
+                                   borderMode=cv2.BORDER_REPLICATE)
 
         return img
 
@@ -172,14 +263,8 @@ class OCREngine:
             # Return original image if OpenCV not available
             return image
 
-        # Convert to OpenCV format
-        img = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-
         # Convert to grayscale
-        if len(img.shape) == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img
+        gray = self._to_gray_array(image)
 
         # Light denoising to reduce noise without destroying text
         denoised = cv2.medianBlur(gray, 1)  # Very light denoising
@@ -190,42 +275,126 @@ class OCREngine:
 
         return Image.fromarray(thresh)
 
-    def recognize(self, image_path: str, is_png: bool = False) -> Dict[str, Any]:
+    def recognize(self, image: Union[str, Path, bytes, Image.Image, Any], is_png: bool = False) -> Dict[str, Any]:
         """
         Recognize text in image
 
         Args:
-            image_path: Image file path
+            image: Image file path, encoded image bytes (e.g. JPEG/PNG), or an in-memory
+                PIL image / numpy array (e.g. a rendered PDF page)
             is_png: Whether this is a PNG file (affects preprocessing)
 
         Returns:
             Dictionary containing text, confidence, and bounding boxes
         """
-        image = Image.open(image_path)
+        if isinstance(image, bytes):
+            # Cloud services take the encoded bytes as-is; local engines decode them
+            if self.config.engine == "google_vision":
+                return self._google_vision_ocr(image)
+            if self.config.engine == "baidu_cloud":
+                return self._baidu_ocr(image)
+            image = Image.open(BytesIO(image))
+
+        in_memory = not isinstance(image, (str, Path))
+        if in_memory and not isinstance(image, Image.Image):
+            image = Image.fromarray(image)
 
         # For cloud OCR services (Google Vision, Baidu), skip local preprocessing
         # as they have their own sophisticated preprocessing pipelines
         if self.config.engine == "google_vision":
-            return self._google_vision_ocr(image)
+            return self._google_vision_ocr(self._vision_content(image))
         elif self.config.engine == "baidu_cloud":
-            return self._baidu_ocr(image_path)  # Baidu needs file path, not PIL image
+            # Baidu needs encoded image bytes, not a PIL image
+            return self._baidu_ocr(self._encode_image(image) if in_memory else image)
         elif self.config.engine == "paddle":
-            return self._paddle_ocr(image_path)  # PaddleOCR works with file paths
+            # PaddleOCR works with file paths or BGR arrays
+            return self._paddle_ocr(self._to_bgr_array(image) if in_memory else image)
         else:
-            # For local OCR (Tesseract), apply preprocessing
+            # For local OCR (Tesseract), decode the image and apply preprocessing
+            if not in_memory:
+                image = self._load_image(image)
             if is_png:
                 image = self.preprocess_image(image, is_png=True)
             return self._tesseract_ocr(image, is_png=is_png)
 
+    def recognize_batch(self, images: List[Union[str, Path, Image.Image, Any]]) -> List[Dict[str, Any]]:
+        """
+        Recognize text in several images
+
+        Google Vision sends up to VISION_BATCH_SIZE images per request instead of one request
+        per image, and the Tesseract CLI runs once per pass over all images (see
+        _tesseract_ocr_batch); the other engines recognize the images one by one.
+
+        Args:
+            images: Image file paths or in-memory PIL images / numpy arrays
+
+        Returns:
+            One result dictionary per image, in input order
+        """
+        if self.uses_tesseract_cli() and len(images) > 1:
+            pages = [self._load_image(image) if isinstance(image, (str, Path))
+                     else image if isinstance(image, Image.Image) else Image.fromarray(image)
+                     for image in images]
+            return self._tesseract_ocr_batch(pages)
+
+        if self.config.engine != "google_vision":
+            return [self.recognize(image) for image in images]
+
+        from google.cloud import vision
+
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+        image_context = vision.ImageContext(language_hints=self._vision_language_hints())
+        results = []
+        for start in range(0, len(images), VISION_BATCH_SIZE):
+            requests = [
+                vision.AnnotateImageRequest(image=vision.Image(content=self._vision_content(image)),
+                                            features=[feature], image_context=image_context)
+                for image in images[start:start + VISION_BATCH_SIZE]
+            ]
+            response = self.client.batch_annotate_images(requests=requests)
+            results.extend(self._parse_vision_response(r) for r in response.responses)
+        return results
+
+    def _vision_language_hints(self) -> List[str]:
+        """Vision language hints for the configured languages, so Vision skips language auto-detection"""
+        codes = (VISION_LANGUAGE_HINTS.get(code) for code in self.config.lang.split('+'))
+        return list(dict.fromkeys(code for code in codes if code))
+
+    @classmethod
+    def _vision_content(cls, image: Union[str, Path, bytes, Image.Image, Any]) -> bytes:
+        """Encoded image bytes for Google Vision"""
+        if isinstance(image, bytes):
+            return image
+        if isinstance(image, (str, Path)):
+            # Vision accepts the encoded file as-is, no need to decode and re-encode it
+            with open(image, 'rb') as f:
+                return f.read()
+        if not isinstance(image, Image.Image):
+            image = Image.fromarray(image)
+        return cls._encode_image(image)
+
+    @staticmethod
+    def _to_bgr_array(image: Image.Image):
+        """Convert PIL image to the BGR array layout OpenCV-based engines expect"""
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        return np.ascontiguousarray(np.asarray(image)[:, :, ::-1])
+
+    @staticmethod
+    def _load_image(image_path: str) -> Image.Image:
+        """Open image for local OCR, letting JPEG decode straight to grayscale"""
+        image = Image.open(image_path)
+        # Configures the decoder before load(); no-op for formats without draft support (PNG)
+        image.draft('L', image.size)
+        return image
+
     def _tesseract_ocr(self, image: Image.Image, is_png: bool = False) -> Dict[str, Any]:
         """Tesseract OCR with Chinese optimization"""
-        import pytesseract
+        use_tesserocr = self._use_tesserocr()
+        if not use_tesserocr:
+            import pytesseract
 
-        # Use configured PSM mode if specified, otherwise try multiple modes
-        if self.config.page_segmentation_mode is not None:
-            psm_modes = [self.config.page_segmentation_mode]
-        else:
-            psm_modes = [6, 3, 1]  # Try different page segmentation modes for auto-selection
+        psm_modes = self._tesseract_psm_modes()
 
         best_result = None
         best_confidence = 0
@@ -237,75 +406,229 @@ class OCREngine:
 
         for img in images_to_try:
             for psm in psm_modes:
-                # Custom configuration optimized for Chinese
-                custom_config = f'--psm {psm} -l {self.config.lang} --oem 3'
-
-                # Add Chinese-specific parameters
-                if 'chi' in self.config.lang:
-                    custom_config += ' -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz\u4e00-\u9fff'
-
-                if self.config.custom_words:
-                    # Create temporary dictionary file
-                    import tempfile
-                    import os
-                    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-                        f.write('\n'.join(self.config.custom_words))
-                        temp_dict_path = f.name
-
-                    custom_config += f' --user-words {temp_dict_path}'
-
+                temp_dict_path = self._write_user_words()
                 try:
                     # OCR with current configuration
-                    data = pytesseract.image_to_data(img,
-                                                   config=custom_config,
-                                                   output_type=pytesseract.Output.DICT)
-
-                    # Extract text and confidence
-                    text = ' '.join([word for word in data['text'] if word.strip()])
-                    confidences = [conf for conf in data['conf'] if conf != -1]
-                    avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+                    if use_tesserocr:
+                        data = self._tesserocr_data(img, psm)
+                    else:
+                        data = pytesseract.image_to_data(img,
+                                                       config=self._tesseract_config(psm, temp_dict_path),
+                                                       output_type=pytesseract.Output.DICT)
 
                     # Keep the best result
-                    if avg_confidence > best_confidence and text.strip():
+                    avg_confidence, result = self._tesseract_candidate(data, psm)
+                    if avg_confidence > best_confidence and result:
                         best_confidence = avg_confidence
-                        best_result = {
-                            'text': text,
-                            'confidence': avg_confidence,
-                            'bboxes': [(data['left'][i], data['top'][i], data['width'][i], data['height'][i])
-                                     for i in range(len(data['text'])) if data['text'][i].strip()],
-                            'psm_used': psm
-                        }
+                        best_result = result
 
                 except Exception as e:
                     print(f"OCR failed with PSM {psm}: {e}")
                     continue
                 finally:
                     # Clean up temporary files
-                    if self.config.custom_words and 'temp_dict_path' in locals():
-                        try:
-                            os.unlink(temp_dict_path)
-                        except:
-                            pass
+                    self._remove_user_words(temp_dict_path)
+
+        return best_result or self._empty_tesseract_result()
+
+    def _tesseract_ocr_batch(self, images: List[Image.Image]) -> List[Dict[str, Any]]:
+        """
+        Tesseract OCR of several pages with one tesseract process per (image variant, PSM) pass
+
+        Pages are packed TESSERACT_BATCH_PAGES at a time into LZW-compressed multi-page TIFFs, so
+        each pass over a chunk costs one process launch and one language model load instead of one
+        per page, while memory and temp space stay bounded; the best pass is still chosen per page.
+
+        Args:
+            images: Page images
+
+        Returns:
+            One result dictionary per page, in input order
+        """
+        results = []
+        temp_dict_path = self._write_user_words()
+        try:
+            for start in range(0, len(images), TESSERACT_BATCH_PAGES):
+                results.extend(self._tesseract_ocr_chunk(images[start:start + TESSERACT_BATCH_PAGES],
+                                                         temp_dict_path))
+        finally:
+            self._remove_user_words(temp_dict_path)
+        return results
+
+    def _tesseract_ocr_chunk(self, images: List[Image.Image], user_words_path: Optional[str]) -> List[Dict[str, Any]]:
+        """Tesseract OCR of one chunk of pages packed into a multi-page TIFF per image variant"""
+        import os
+        import tempfile
+        import pytesseract
+
+        psm_modes = self._tesseract_psm_modes()
+        best_results = [None] * len(images)
+        best_confidences = [0] * len(images)
+
+        # Try both original pages and preprocessed pages (if OpenCV available); preprocessed copies
+        # are made one variant at a time, so only one extra copy of the chunk is alive
+        variants = [lambda: images]
+        if CV2_AVAILABLE:
+            variants.append(lambda: [self._preprocess_chinese_image(image) for image in images])
+
+        for make_pages in variants:
+            fd, tiff_path = tempfile.mkstemp(suffix='.tif')
+            os.close(fd)
+            try:
+                pages = make_pages()
+                pages[0].save(tiff_path, format='TIFF', save_all=True, append_images=pages[1:],
+                              compression='tiff_lzw')
+                del pages
+
+                for psm in psm_modes:
+                    try:
+                        data = pytesseract.image_to_data(tiff_path,
+                                                       config=self._tesseract_config(psm, user_words_path),
+                                                       output_type=pytesseract.Output.DICT)
+                    except Exception as e:
+                        print(f"OCR failed with PSM {psm}: {e}")
+                        continue
+
+                    # Split the TSV rows by page (page_num is 1-based)
+                    rows_by_page = [[] for _ in images]
+                    for row, page_num in enumerate(data['page_num']):
+                        if 1 <= page_num <= len(images):
+                            rows_by_page[page_num - 1].append(row)
+
+                    for page, rows in enumerate(rows_by_page):
+                        page_data = {key: [data[key][row] for row in rows]
+                                     for key in ('text', 'conf', 'left', 'top', 'width', 'height')}
+                        avg_confidence, result = self._tesseract_candidate(page_data, psm)
+                        if avg_confidence > best_confidences[page] and result:
+                            best_confidences[page] = avg_confidence
+                            best_results[page] = result
+            finally:
+                os.unlink(tiff_path)
+
+        return [result or self._empty_tesseract_result() for result in best_results]
+
+    def _tesseract_psm_modes(self) -> List[int]:
+        """Use configured PSM mode if specified, otherwise try multiple modes"""
+        if self.config.page_segmentation_mode is not None:
+            return [self.config.page_segmentation_mode]
+        return [6, 3, 1]  # Try different page segmentation modes for auto-selection
+
+    def _tesseract_config(self, psm: int, user_words_path: Optional[str] = None) -> str:
+        """Tesseract command-line configuration for a PSM mode"""
+        # Custom configuration optimized for Chinese
+        custom_config = f'--psm {psm} -l {self.config.lang} --oem 3'
+
+        # Add Chinese-specific parameters
+        if 'chi' in self.config.lang:
+            custom_config += ' -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz\u4e00-\u9fff'
+
+        if user_words_path:
+            custom_config += f' --user-words {user_words_path}'
+        return custom_config
+
+    def _write_user_words(self) -> Optional[str]:
+        """Write custom_words to a temporary dictionary file for tesseract, if configured"""
+        if not self.config.custom_words:
+            return None
+        import tempfile
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write('\n'.join(self.config.custom_words))
+            return f.name
+
+    @staticmethod
+    def _remove_user_words(path: Optional[str]):
+        """Remove a temporary dictionary file written by _write_user_words"""
+        if path:
+            import os
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _tesseract_candidate(data: Dict[str, List], psm: int) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """Average confidence and result (None if no words) of one tesseract pass"""
+        # Extract text and confidence (strip each word only once)
+        words = data['text']
+        keep = [i for i, word in enumerate(words) if word.strip()]
+        confidences = [conf for conf in data['conf'] if conf != -1]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        if not keep:
+            return avg_confidence, None
+
+        left, top, width, height = data['left'], data['top'], data['width'], data['height']
+        return avg_confidence, {
+            'text': ' '.join(words[i] for i in keep),
+            'confidence': avg_confidence,
+            'bboxes': [(left[i], top[i], width[i], height[i]) for i in keep],
+            'psm_used': psm
+        }
 
-        return best_result or {
+    @staticmethod
+    def _empty_tesseract_result() -> Dict[str, Any]:
+        return {
             'text': '',
             'confidence': 0.0,
             'bboxes': [],
             'psm_used': None
         }
 
-    def _google_vision_ocr(self, image: Image.Image) -> Dict[str, Any]:
-        """Google Vision OCR"""
+    def _tesserocr_data(self, image: Image.Image, psm: int) -> Dict[str, List]:
+        """
+        Word-level OCR through the persistent tesserocr API
+
+        Args:
+            image: PIL image
+            psm: Page segmentation mode
+
+        Returns:
+            Dict with the text/conf/left/top/width/height columns used from pytesseract.image_to_data
+        """
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        with _TESSERACT_LOCK:
+            api = _get_tesseract_api(self.config.lang)
+            api.SetPageSegMode(psm)
+            # Same whitelist as the CLI path; variables persist on the API, so always reset it
+            whitelist = ''
+            if 'chi' in self.config.lang:
+                whitelist = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz\u4e00-\u9fff'
+            api.SetVariable('tessedit_char_whitelist', whitelist)
+            api.SetImage(image)
+            api.Recognize()
+
+            iterator = api.GetIterator()
+            if iterator is None:
+                return data
+            for word in iterate_level(iterator, RIL.WORD):
+                bbox = word.BoundingBox(RIL.WORD)
+                if bbox is None:
+                    continue
+                x1, y1, x2, y2 = bbox
+                data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+                data['conf'].append(word.Confidence(RIL.WORD))
+                data['left'].append(x1)
+                data['top'].append(y1)
+                data['width'].append(x2 - x1)
+                data['height'].append(y2 - y1)
+        return data
+
+    def _google_vision_ocr(self, image: Union[bytes, Image.Image]) -> Dict[str, Any]:
+        """Google Vision OCR (accepts encoded image bytes or a PIL image)"""
         from google.cloud import vision
-        from io import BytesIO
 
-        # Convert to bytes
-        buffer = BytesIO()
-        image.save(buffer, format='PNG')
-        content = buffer.getvalue()
+        if isinstance(image, Image.Image):
+            content = self._encode_image(image)
+        else:
+            content = image
 
         image = vision.Image(content=content)
-        response = self.client.text_detection(image=image)
+        image_context = vision.ImageContext(language_hints=self._vision_language_hints())
+        response = self.client.text_detection(image=image, image_context=image_context)
+        return self._parse_vision_response(response)
+
+    @staticmethod
+    def _parse_vision_response(response) -> Dict[str, Any]:
+        """Convert a Vision text detection response into our result format"""
         texts = response.text_annotations
 
         if texts:
@@ -323,12 +646,38 @@ class OCREngine:
             'bboxes': bboxes
         }
 
-    def _baidu_ocr(self, image_path: str) -> Dict[str, Any]:
-        """Baidu Cloud OCR"""
+    @staticmethod
+    def _encode_image(image: Image.Image, quality: int = 90) -> bytes:
+        """
+        Encode PIL image for upload to a cloud OCR service
+
+        JPEG is much cheaper to encode than PNG's zlib deflate; images with transparency are
+        encoded as PNG, since dropping the alpha channel can make transparent text unreadable.
+        """
+        buffer = getattr(_ENCODE_BUFFER, 'buffer', None)
+        if buffer is None:
+            buffer = _ENCODE_BUFFER.buffer = BytesIO()
+        # Reuse this thread's buffer instead of allocating a new one per image
+        buffer.seek(0)
+        buffer.truncate()
+
+        if image.mode in ('RGBA', 'LA') or 'transparency' in image.info:
+            image.save(buffer, format='PNG')
+        else:
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            image.save(buffer, format='JPEG', quality=quality, optimize=False)
+        return buffer.getvalue()
+
+    def _baidu_ocr(self, image: Union[str, Path, bytes]) -> Dict[str, Any]:
+        """Baidu Cloud OCR (accepts an image file path or encoded image bytes)"""
         try:
-            # Read image file
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
+            if isinstance(image, bytes):
+                image_data = image
+            else:
+                # Read image file
+                with open(image, 'rb') as f:
+                    image_data = f.read()
 
             # Call Baidu OCR API
             result = self.client.basicGeneral(image_data)
@@ -379,45 +728,40 @@ class OCREngine:
                 'bboxes': []
             }
 
-    def _paddle_ocr(self, image_path: str) -> Dict[str, Any]:
-        """PaddleOCR"""
+    def _paddle_ocr(self, image: Union[str, Path, Any]) -> Dict[str, Any]:
+        """PaddleOCR (accepts an image file path or a BGR numpy array)"""
         try:
             # Run PaddleOCR
-            results = self.client.ocr(image_path, cls=True)
+            results = self.client.ocr(image, cls=True)
 
             if results and results[0]:
-                # Extract text and confidence from results
+                # Extract text, confidence and box corners from results
                 text_lines = []
-                total_confidence = 0
-                word_count = 0
-                bboxes = []
+                confidences = []
+                quads = []
 
                 for line in results[0]:
-                    if len(line) >= 2:
+                    if len(line) >= 2 and len(line[1]) >= 2:
                         bbox = line[0]  # Bounding box coordinates
-                        text_info = line[1]  # Text and confidence
-
-                        if len(text_info) >= 2:
-                            text = text_info[0]
-                            confidence = text_info[1]
+                        text_lines.append(line[1][0])
+                        confidences.append(line[1][1])
+                        # PaddleOCR detection boxes are 4-point quads
+                        if bbox is not None and len(bbox) == 4:
+                            quads.append(bbox)
 
-                            text_lines.append(text)
-                            total_confidence += confidence
-                            word_count += 1
-
-                            # Convert bbox to our format (x, y, width, height)
-                            if bbox and len(bbox) >= 4:
-                                x_coords = [point[0] for point in bbox]
-                                y_coords = [point[1] for point in bbox]
-                                x_min, x_max = min(x_coords), max(x_coords)
-                                y_min, y_max = min(y_coords), max(y_coords)
-                                bboxes.append((x_min, y_min, x_max - x_min, y_max - y_min))
+                # Convert bboxes to our format (x, y, width, height) in one vectorized pass
+                bboxes = []
+                if quads:
+                    points = np.asarray(quads, dtype=np.float64)  # (N, 4, 2)
+                    mins = points.min(axis=1)
+                    sizes = points.max(axis=1) - mins
+                    bboxes = [tuple(box) for box in np.hstack((mins, sizes)).tolist()]
 
                 # Join text lines with spaces to create continuous readable text
                 full_text = ' '.join(text_lines)
 
                 # Calculate average confidence (PaddleOCR confidence is 0-1, convert to 0-100)
-                avg_confidence = (total_confidence / word_count * 100) if word_count > 0 else 85.0
+                avg_confidence = float(np.mean(confidences)) * 100 if confidences else 85.0
 
                 return {
                     'text': full_text,
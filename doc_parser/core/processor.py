@@ -3,13 +3,52 @@ Document Processor Module
 Integrates OCR and structured extraction
 """
 
+import csv
+import functools
 import os
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+import numpy as np
+from PIL import Image
 from pydantic import BaseModel, Field
 
 from .ocr import OCREngine, OCRConfig
 from .extractor import StructuredExtractor, ExtractionConfig, ExtractedField
+from ..utils.json_io import write_json
+
+
+PDF_RENDER_DPI = 200  # Matches pdf2image's default resolution
+PDF_MIN_TEXT_CHARS = 100  # A PDF with at least this much text is read without OCR
+PDF_MIN_PAGE_TEXT_CHARS = 20  # Pages of other PDFs with less text than this are OCR'd
+VALIDATION_CSV_FIELDS = ['filename', 'field_name', 'extracted_value', 'confidence']
+PDF_TEXT_CACHE_SIZE = 32  # PDFs whose text-layer probe is remembered per process
+PDFTOPPM_MAX_RUN = 4  # Pages rendered per pdftoppm call in the pdf2image fallback
+OCR_BATCH_PAGES = 16  # Pages rendered and handed to one recognize_batch call at a time
+SAVE_IO_WORKERS = 8  # Threads used by save_results to overlap file writes
+
+# PNG text post-processing patterns, compiled once at import
+_RE_LOWER_UPPER = re.compile(r'([a-z])([A-Z])')
+# Letter/digit boundaries in either order, zero-width so that "a1b" gets both spaces in one pass
+_RE_ALNUM_BOUNDARY = re.compile(r'(?<=[a-zA-Z])(?=\d)|(?<=\d)(?=[a-zA-Z])')
+_RE_WS = re.compile(r'\s+')
+# Every English fix-up below needs an ASCII letter to match, so text without one skips them
+_RE_ASCII_LETTER = re.compile(r'[a-zA-Z]')
+
+# Common OCR word merges, split by inserting a space at each (left, right) boundary
+_OCR_WORD_SPLITS = (
+    ('will', 'have'),
+    ('You', 'will'),
+    ('the', 'position'),
+    ('of', 'Software'),
+)
+# Zero-width alternation: all splits are applied in a single scan of the text
+_RE_OCR_WORD_SPLITS = re.compile('|'.join(
+    f'(?<={re.escape(left)})(?={re.escape(right)})' for left, right in _OCR_WORD_SPLITS
+))
 
 
 class ValidationConfig(BaseModel):
@@ -26,6 +65,7 @@ class DocumentProcessorConfig(BaseModel):
     ocr: OCRConfig
     extraction: ExtractionConfig
     validation: ValidationConfig = Field(default_factory=ValidationConfig)
+    page_workers: Optional[int] = Field(default=1, description="Worker processes for per-page PDF OCR with local engines (1 = sequential, None = CPU count)")
 
 
 class StructuredOutput(BaseModel):
@@ -38,6 +78,126 @@ class StructuredOutput(BaseModel):
     overall_confidence: float
     validation_passed: bool
 
+    @property
+    def field_confidences(self) -> np.ndarray:
+        """Confidence of each extracted field as one float64 column (same order as extracted_fields)"""
+        return np.fromiter((f.confidence for f in self.extracted_fields), dtype=np.float64,
+                           count=len(self.extracted_fields))
+
+    def low_confidence_rows(self, threshold_percent: float) -> List[Dict[str, Any]]:
+        """
+        Validation CSV rows for fields below a confidence threshold
+
+        Args:
+            threshold_percent: Confidence threshold (0-100)
+
+        Returns:
+            One row per low-confidence field, with VALIDATION_CSV_FIELDS keys
+        """
+        fields = self.extracted_fields
+        low = np.flatnonzero(self.field_confidences < threshold_percent)
+        return [
+            {
+                'filename': self.filename,
+                'field_name': fields[i].name,
+                'extracted_value': fields[i].value,
+                'confidence': fields[i].confidence
+            }
+            for i in low.tolist()
+        ]
+
+
+@functools.lru_cache(maxsize=PDF_TEXT_CACHE_SIZE)
+def _read_pdf_text(pdf_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read the text layer of a PDF (memoized; mtime_ns and size make modified files miss the cache)"""
+    import pdfplumber
+    all_text = []
+    page_texts = []
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                all_text.append(page_text)
+                page_text = page_text.strip()
+            page_texts.append(page_text if page_text and len(page_text) >= PDF_MIN_PAGE_TEXT_CHARS else None)
+
+    combined_text = '\n'.join(all_text).strip()
+
+    return {
+        # Check if we got meaningful text (more than just whitespace)
+        'has_text': len(combined_text) > PDF_MIN_TEXT_CHARS,
+        'text': combined_text,
+        'pages': len(all_text),
+        'page_texts': page_texts
+    }
+
+
+def _page_runs(page_indices: Iterable[int], max_run: int) -> Iterator[tuple]:
+    """Group sorted 0-based page indices into (first, last) runs of at most max_run consecutive pages"""
+    first = last = None
+    for i in page_indices:
+        if first is not None and i == last + 1 and i - first < max_run:
+            last = i
+            continue
+        if first is not None:
+            yield first, last
+        first = last = i
+    if first is not None:
+        yield first, last
+
+
+# OCR engine of a page worker process, created once by _init_page_worker
+_page_worker_engine: Optional[OCREngine] = None
+
+
+def _init_page_worker(ocr_config: OCRConfig):
+    """Pool initializer: build one OCR engine per worker process"""
+    global _page_worker_engine
+    _page_worker_engine = OCREngine(ocr_config)
+
+
+def _ocr_page(page: tuple) -> tuple:
+    """OCR one (index, page image) pair in a worker process, returning (index, result, error)"""
+    i, image = page
+    try:
+        return i, _page_worker_engine.recognize(image), None
+    except Exception as e:
+        return i, None, str(e)
+
+
+# Document processor of a batch worker process, created once by _init_file_worker
+_file_worker_processor: Optional["DocumentProcessor"] = None
+
+
+def _init_file_worker(config: DocumentProcessorConfig):
+    """Executor initializer: build one processor per worker process"""
+    global _file_worker_processor
+    # Files are already spread across processes, so OCR their pages sequentially
+    _file_worker_processor = DocumentProcessor(config.model_copy(update={'page_workers': 1}))
+
+
+def _process_file_worker(file_path: str) -> tuple:
+    """Process one file in a worker process, returning (result, error)"""
+    try:
+        return _file_worker_processor.process_file(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def write_validation_csv(path: str, rows: List[Dict[str, Any]]):
+    """Write low-confidence rows as the validation CSV (os.linesep line endings, like DataFrame.to_csv)"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=VALIDATION_CSV_FIELDS, lineterminator=os.linesep)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _write_text(path: str, text: str):
+    """Write a UTF-8 text file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
 
 class DocumentProcessor:
     """Document processor"""
@@ -46,6 +206,167 @@ class DocumentProcessor:
         self.config = config
         self.ocr_engine = OCREngine(config.ocr)
         self.extractor = StructuredExtractor(config.extraction)
+        # Page OCR pool is created on first multi-page PDF and reused afterwards
+        self._page_pool = None
+        self._page_pool_ocr_config = None
+
+    def close(self):
+        """Shut down the page OCR worker pool (if started)"""
+        if self._page_pool is not None:
+            self._page_pool.close()
+            self._page_pool.join()
+            self._page_pool = None
+            self._page_pool_ocr_config = None
+
+    def _uses_page_pool(self) -> bool:
+        """Whether multi-page OCR is spread over worker processes"""
+        # Only CPU-bound local engines gain from extra processes; cloud engines are network-bound
+        return self.config.page_workers != 1 and (
+            self.config.ocr.engine == "paddle" or self.ocr_engine.uses_tesseract_cli())
+
+    def _get_page_pool(self):
+        """Get the page OCR pool, recreating it if the OCR configuration changed"""
+        if self._page_pool is not None and self._page_pool_ocr_config is not self.config.ocr:
+            self.close()
+        if self._page_pool is None:
+            workers = self.config.page_workers or os.cpu_count() or 1
+            # Spawn, not fork: workers must not inherit this process's loaded models, OpenMP/gRPC
+            # state, locks or client sockets; each builds its own engine in _init_page_worker
+            self._page_pool = multiprocessing.get_context("spawn").Pool(
+                processes=workers,
+                initializer=_init_page_worker,
+                initargs=(self.config.ocr,)
+            )
+            self._page_pool_ocr_config = self.config.ocr
+        return self._page_pool
+
+    def _ocr_pages(self, images: Iterable, page_count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        OCR page images, in parallel worker processes when there is more than one page
+
+        Args:
+            images: Page images (PIL images or file paths); may be a lazy iterator, in which case
+                pages are rendered while earlier pages are being recognized
+            page_count: Number of pages, required when images has no len()
+
+        Returns:
+            OCR result of each page in page order (None for pages that failed)
+        """
+        if page_count is None:
+            page_count = len(images)
+
+        # Cloud OCR: batched requests instead of one round trip per page. Tesseract CLI: one process
+        # per pass over each chunk of pages, when pages are not spread over worker processes instead
+        if page_count > 1 and (self.config.ocr.engine == "google_vision" or
+                               (not self._uses_page_pool() and self.ocr_engine.uses_tesseract_cli())):
+            results = []
+            pages = iter(images)
+            # Fixed-size chunks: only one chunk of rendered pages is held in memory at a time
+            for chunk in iter(lambda: list(islice(pages, OCR_BATCH_PAGES)), []):
+                try:
+                    results.extend(self.ocr_engine.recognize_batch(chunk))
+                except Exception as e:
+                    print(f"Batched OCR failed: {e}, recognizing pages "
+                          f"{len(results)+1}-{len(results)+len(chunk)} one by one")
+                    for image in chunk:
+                        try:
+                            results.append(self.ocr_engine.recognize(image))
+                        except Exception as page_error:
+                            print(f"OCR failed for page {len(results)+1}: {page_error}")
+                            results.append(None)
+            return results
+
+        if page_count <= 1 or not self._uses_page_pool():
+            outcomes = []
+            for i, image in enumerate(images):
+                print(f"Processing page {i+1}/{page_count}...")
+                try:
+                    outcomes.append((i, self.ocr_engine.recognize(image), None))
+                except Exception as e:
+                    outcomes.append((i, None, str(e)))
+        else:
+            outcomes = []
+            pool = self._get_page_pool()
+            # The pool's task feeder thread pulls pages from the iterator, so rendering in this
+            # process overlaps with OCR in the workers
+            for outcome in pool.imap_unordered(_ocr_page, enumerate(images)):
+                outcomes.append(outcome)
+                print(f"Processed page {outcome[0]+1}/{page_count} ({len(outcomes)} done)")
+            outcomes.sort(key=lambda outcome: outcome[0])
+
+        results = []
+        for i, ocr_result, error in outcomes:
+            if error is not None:
+                print(f"OCR failed for page {i+1}: {error}")
+            results.append(ocr_result)
+        return results
+
+    def _recognize_pdf(self, file_path: str) -> Dict[str, Any]:
+        """
+        Get the text of a PDF: from its text layer where usable, OCR for the other pages
+
+        Args:
+            file_path: PDF file path
+
+        Returns:
+            Combined OCR-style result with text, confidence and bboxes
+        """
+        # Try to extract text directly from PDF first
+        text_result = self._extract_text_from_pdf(file_path)
+        if text_result['has_text']:
+            # PDF has extractable text, use it directly
+            all_text = text_result['text']
+            combined_ocr = {
+                'text': all_text,
+                'confidence': 95.0,  # High confidence for direct text extraction
+                'bboxes': []
+            }
+        else:
+            # Only pages without a usable text layer need OCR; the rest keep their extracted text
+            page_texts = text_result['page_texts']
+            ocr_indices = None
+            if page_texts is not None:
+                ocr_indices = [i for i, page_text in enumerate(page_texts) if page_text is None]
+
+            if ocr_indices is None or len(ocr_indices) == len(page_texts):
+                # PDF is image-based, use optimized OCR for Chinese content
+                print(f"Processing image-based PDF with OCR (this may take time for Chinese text)...")
+            else:
+                print(f"Processing {len(ocr_indices)} of {len(page_texts)} PDF pages with OCR...")
+
+            if ocr_indices is None:
+                images = self._convert_pdf_to_images(file_path)
+                page_count = len(images)
+            else:
+                # Render lazily, page by page, so OCR starts on the first page right away
+                images = self._iter_pdf_pages(file_path, ocr_indices)
+                page_count = len(ocr_indices)
+
+            # OCR pages across worker processes, then put them back in page order
+            ocr_results = iter(self._ocr_pages(images, page_count))
+            if page_texts is None:
+                page_results = list(ocr_results)
+            else:
+                page_results = [
+                    next(ocr_results) if page_text is None
+                    else {'text': page_text, 'confidence': 95.0, 'bboxes': []}
+                    for page_text in page_texts
+                ]
+            # Failed pages are skipped
+            all_results = [r for r in page_results if r is not None]
+
+            all_text = '\n'.join(r['text'] for r in all_results).strip()
+            confidences = np.fromiter((r['confidence'] for r in all_results), dtype=np.float64,
+                                      count=len(all_results))
+
+            # Combine OCR results
+            combined_ocr = {
+                'text': all_text,
+                'confidence': float(confidences.mean()) if confidences.size else 0.0,
+                'bboxes': list(chain.from_iterable(r['bboxes'] for r in all_results))
+            }
+
+        return combined_ocr
 
     def process_file(self, file_path: str) -> StructuredOutput:
         """
@@ -61,40 +382,8 @@ class DocumentProcessor:
         ext = path.suffix.lower()
 
         if ext == '.pdf':
-            # Try to extract text directly from PDF first
-            text_result = self._extract_text_from_pdf(file_path)
-            if text_result['has_text']:
-                # PDF has extractable text, use it directly
-                all_text = text_result['text']
-                combined_ocr = {
-                    'text': all_text,
-                    'confidence': 95.0,  # High confidence for direct text extraction
-                    'bboxes': []
-                }
-            else:
-                # PDF is image-based, use optimized OCR for Chinese content
-                print(f"Processing image-based PDF with OCR (this may take time for Chinese text)...")
-                images = self._convert_pdf_to_images(file_path)
-                all_text = ""
-                all_results = []
-
-                # OCR process each image with timeout protection
-                for i, img_path in enumerate(images):
-                    print(f"Processing page {i+1}/{len(images)}...")
-                    try:
-                        ocr_result = self.ocr_engine.recognize(img_path)
-                        all_text += ocr_result['text'] + "\n"
-                        all_results.append(ocr_result)
-                    except Exception as e:
-                        print(f"OCR failed for page {i+1}: {e}")
-                        continue
-
-                # Combine OCR results
-                combined_ocr = {
-                    'text': all_text.strip(),
-                    'confidence': sum(r['confidence'] for r in all_results) / len(all_results) if all_results else 0,
-                    'bboxes': [bbox for r in all_results for bbox in r['bboxes']]
-                }
+            combined_ocr = self._recognize_pdf(file_path)
+            all_text = combined_ocr['text']
         else:
             # For image files, use OCR directly with PNG-specific preprocessing
             is_png = ext == '.png'
@@ -115,59 +404,79 @@ class DocumentProcessor:
         # Structured extraction
         extracted_fields = self.extractor.extract(all_text, combined_ocr)
 
-        # Validation
-        low_confidence = [f.name for f in extracted_fields
-                         if f.confidence / 100.0 < self.config.validation.confidence_threshold]
+        # Validation: low-confidence and present field names in a single pass
+        threshold = self.config.validation.confidence_threshold
+        low_confidence = []
+        extracted_field_names = set()
+        for f in extracted_fields:
+            if f.confidence / 100.0 < threshold:
+                low_confidence.append(f.name)
+            if f.value:
+                extracted_field_names.add(f.name)
 
         # Check required fields
-        extracted_field_names = {f.name for f in extracted_fields if f.value}
         missing_required = [field for field in self.config.validation.required_fields
                            if field not in extracted_field_names]
 
         # Overall validation
         validation_passed = len(low_confidence) == 0 and len(missing_required) == 0
 
-        return StructuredOutput(
+        # All values are built here with the right types, so skip Pydantic re-validation
+        return StructuredOutput.model_construct(
             filename=Path(file_path).name,
             raw_text=all_text,
             extracted_fields=extracted_fields,
             low_confidence_fields=low_confidence,
             missing_required_fields=missing_required,
-            overall_confidence=combined_ocr['confidence'],
+            overall_confidence=float(combined_ocr['confidence']),
             validation_passed=validation_passed
         )
 
-    def process_files_batch(self, file_paths: List[str]) -> List[StructuredOutput]:
+    def process_files_batch(self, file_paths: List[str], max_workers: Optional[int] = 1) -> List[StructuredOutput]:
         """
         Batch process files
 
         Args:
             file_paths: List of file paths
+            max_workers: Worker processes to spread files over (1 = sequential in this process, None = CPU count)
 
         Returns:
             List of structured outputs
         """
+        workers = min(max_workers or os.cpu_count() or 1, len(file_paths))
+
+        if workers <= 1:
+            outcomes = []
+            for file_path in file_paths:
+                try:
+                    outcomes.append((self.process_file(file_path), None))
+                except Exception as e:
+                    outcomes.append((None, str(e)))
+        else:
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            # Spawned, not forked: workers build their own models and clients instead of inheriting ours
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_file_worker, initargs=(self.config,)) as executor:
+                outcomes = list(executor.map(_process_file_worker, file_paths, chunksize=chunksize))
+
         results = []
-        for file_path in file_paths:
-            try:
-                result = self.process_file(file_path)
-                results.append(result)
-            except Exception as e:
+        for file_path, (result, error) in zip(file_paths, outcomes):
+            if error is not None:
                 # Create error result
-                error_result = StructuredOutput(
+                result = StructuredOutput.model_construct(
                     filename=Path(file_path).name,
-                    raw_text=f"Processing failed: {str(e)}",
+                    raw_text=f"Processing failed: {error}",
                     extracted_fields=[],
                     low_confidence_fields=[],
                     missing_required_fields=self.config.validation.required_fields.copy(),
                     overall_confidence=0.0,
                     validation_passed=False
                 )
-                results.append(error_result)
+            results.append(result)
 
         return results
 
-    def _load_images(self, file_path: str) -> List[str]:
+    def _load_images(self, file_path: str) -> list:
         """
         Load file as image list
 
@@ -175,7 +484,7 @@ class DocumentProcessor:
             file_path: File path
 
         Returns:
-            List of image file paths
+            List of images (file path for image files, in-memory pages for PDFs)
         """
         path = Path(file_path)
         ext = path.suffix.lower()
@@ -188,83 +497,85 @@ class DocumentProcessor:
             raise ValueError(f"Unsupported file type: {ext}")
 
     def _extract_text_from_pdf(self, pdf_path: str) -> Dict[str, Any]:
-        """Extract text directly from PDF"""
-        try:
-            import pdfplumber
-            all_text = []
-
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        all_text.append(page_text)
-
-            combined_text = '\n'.join(all_text)
+        """
+        Extract text directly from PDF
 
-            # Check if we got meaningful text (more than just whitespace)
-            has_text = len(combined_text.strip()) > 100  # At least 100 characters
+        Args:
+            pdf_path: PDF file path
 
-            return {
-                'has_text': has_text,
-                'text': combined_text.strip(),
-                'pages': len(all_text)
-            }
+        Returns:
+            Dictionary with has_text, text, pages and page_texts (stripped text of each page, None
+            where the page needs OCR)
+        """
+        try:
+            stat = os.stat(pdf_path)
+            # Copy so callers never modify the memoized result
+            return dict(_read_pdf_text(str(pdf_path), stat.st_mtime_ns, stat.st_size))
 
         except ImportError:
             print("pdfplumber not available, falling back to OCR")
-            return {'has_text': False, 'text': '', 'pages': 0}
+            return {'has_text': False, 'text': '', 'pages': 0, 'page_texts': None}
         except Exception as e:
             print(f"PDF text extraction failed: {e}, falling back to OCR")
-            return {'has_text': False, 'text': '', 'pages': 0}
+            return {'has_text': False, 'text': '', 'pages': 0, 'page_texts': None}
 
-    def _convert_pdf_to_images(self, pdf_path: str) -> List[str]:
-        """Convert PDF to images"""
+    def _convert_pdf_to_images(self, pdf_path: str, page_indices: Optional[List[int]] = None) -> list:
+        """Convert PDF (all pages, or only the given 0-based page indices) to in-memory PIL page images"""
         try:
-            import pdf2image
-            import tempfile
-
-            # Convert to images
-            images = pdf2image.convert_from_path(pdf_path)
-
-            # Save to temporary files
-            temp_files = []
-            for i, img in enumerate(images):
-                temp_file = tempfile.NamedTemporaryFile(suffix=f'_page_{i}.png', delete=False)
-                img.save(temp_file.name, 'PNG')
-                temp_files.append(temp_file.name)
-
-            return temp_files
+            # Pages stay in memory and are handed to OCR directly
+            return list(self._iter_pdf_pages(pdf_path, page_indices))
 
         except ImportError:
-            raise ImportError("pdf2image not installed")
+            raise ImportError("pypdfium2 or pdf2image not installed")
         except Exception as e:
             raise RuntimeError(f"PDF conversion failed: {str(e)}")
 
+    def _iter_pdf_pages(self, pdf_path: str, page_indices: Optional[List[int]] = None) -> Iterator[Image.Image]:
+        """Render PDF pages to PIL images one at a time (pypdfium2 in-process, pdf2image/poppler as fallback)"""
+        try:
+            import pypdfium2 as pdfium
+        except ImportError:
+            import pdf2image
+            if page_indices is None:
+                page_indices = range(pdf2image.pdfinfo_from_path(pdf_path)['Pages'])
+            # One pdftoppm process per run of consecutive pages rather than per page
+            for first, last in _page_runs(page_indices, PDFTOPPM_MAX_RUN):
+                yield from pdf2image.convert_from_path(pdf_path, dpi=PDF_RENDER_DPI,
+                                                       first_page=first + 1, last_page=last + 1)
+            return
+
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            if page_indices is None:
+                page_indices = range(len(pdf))
+            for i in page_indices:
+                yield pdf[i].render(scale=PDF_RENDER_DPI / 72).to_pil()
+        finally:
+            pdf.close()
+
     def _postprocess_png_text(self, text: str) -> str:
         """Post-process PNG OCR text to fix spacing issues"""
         if not text:
             return text
 
-        import re
+        # Pure CJK/numeric text: only whitespace cleanup applies
+        if not _RE_ASCII_LETTER.search(text):
+            return _RE_WS.sub(' ', text).strip()
 
         # Fix common spacing issues in PNG OCR results
 
         # 1. Add spaces between concatenated words (English)
         # Look for patterns like: "Youwillhave" -> "You will have"
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+        text = _RE_LOWER_UPPER.sub(r'\1 \2', text)
 
         # 2. Add spaces around numbers
-        text = re.sub(r'([a-zA-Z])(\d)', r'\1 \2', text)
-        text = re.sub(r'(\d)([a-zA-Z])', r'\1 \2', text)
+        text = _RE_ALNUM_BOUNDARY.sub(' ', text)
 
         # 3. Fix common OCR errors
-        text = text.replace('willhave', 'will have')
-        text = text.replace('Youwill', 'You will')
-        text = text.replace('theposition', 'the position')
-        text = text.replace('ofSoftware', 'of Software')
+        text = _RE_OCR_WORD_SPLITS.sub(' ', text)
 
         # 4. Clean up excessive spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_WS.sub(' ', text)
 
         return text.strip()
 
@@ -278,39 +589,31 @@ class DocumentProcessor:
             save_raw_text: Whether to save raw text
             save_json: Whether to save JSON
         """
-        import json
-        import pandas as pd
-
         os.makedirs(output_dir, exist_ok=True)
 
-        # Save structured results for each file
-        for result in results:
-            base_name = Path(result.filename).stem
+        # Save structured results for each file; file writes release the GIL, so overlap them on threads
+        with ThreadPoolExecutor(max_workers=SAVE_IO_WORKERS) as executor:
+            futures = []
+            for result in results:
+                base_name = Path(result.filename).stem
+
+                if save_raw_text:
+                    raw_text_path = os.path.join(output_dir, f"{base_name}_raw.txt")
+                    futures.append(executor.submit(_write_text, raw_text_path, result.raw_text))
 
-            if save_raw_text:
-                raw_text_path = os.path.join(output_dir, f"{base_name}_raw.txt")
-                with open(raw_text_path, 'w', encoding='utf-8') as f:
-                    f.write(result.raw_text)
+                if save_json:
+                    json_path = os.path.join(output_dir, f"{base_name}_structured.json")
+                    futures.append(executor.submit(write_json, json_path, result.model_dump()))
 
-            if save_json:
-                json_path = os.path.join(output_dir, f"{base_name}_structured.json")
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(result.dict(), f, ensure_ascii=False, indent=2)
+            # Surface the first write error, as the sequential loop did
+            for future in futures:
+                future.result()
 
         # Save validation list
         low_conf_rows = []
         threshold_percent = self.config.validation.confidence_threshold * 100
         for res in results:
-            for field in res.extracted_fields:
-                if field.confidence < threshold_percent:
-                    low_conf_rows.append({
-                        'filename': res.filename,
-                        'field_name': field.name,
-                        'extracted_value': field.value,
-                        'confidence': field.confidence
-                    })
+            low_conf_rows.extend(res.low_confidence_rows(threshold_percent))
 
         if low_conf_rows:
-            df = pd.DataFrame(low_conf_rows)
-            csv_path = os.path.join(output_dir, "validation_list.csv")
-            df.to_csv(csv_path, index=False, encoding='utf-8')
+            write_validation_csv(os.path.join(output_dir, "validation_list.csv"), low_conf_rows)
@@ -0,0 +1,25 @@
+"""
+Google Vision client
+One shared ImageAnnotatorClient per credentials file, for the OCR engine and the setup scripts
+"""
+
+import functools
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=4)
+def get_vision_client(credentials_path: Optional[str] = None):
+    """
+    Get (or lazily create) a shared Google Vision client
+
+    Args:
+        credentials_path: Service account key file; None uses Application Default Credentials
+
+    Returns:
+        vision.ImageAnnotatorClient, created once per credentials path
+    """
+    from google.cloud import vision
+    if credentials_path:
+        # Load the key directly instead of walking the ADC lookup chain (env, gcloud config, metadata server)
+        return vision.ImageAnnotatorClient.from_service_account_json(credentials_path)
+    return vision.ImageAnnotatorClient()
@@ -4,11 +4,38 @@ Command-line batch document processing
 """
 
 import argparse
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from ..api.client import DocumentParserClient
+from .json_io import write_json
+
+
+# Client of a worker process, created once by _init_worker
+_worker_client: Optional[DocumentParserClient] = None
+
+
+def _init_worker(config_path: Optional[str], sequential_pages: bool = True):
+    """Executor initializer: load configuration and models once per worker process"""
+    global _worker_client
+    _worker_client = DocumentParserClient(config_path=config_path)
+    if sequential_pages:
+        # Files are already spread across processes, so OCR their pages sequentially
+        processor = _worker_client.processor
+        processor.config = processor.config.model_copy(update={'page_workers': 1})
+
+
+def _process_one(file_path: Path) -> tuple:
+    """Process one file in a worker process, returning (result, error)"""
+    try:
+        return _worker_client.process_file(file_path), None
+    except Exception as e:
+        return None, str(e)
 
 
 def main():
@@ -26,6 +53,9 @@ Usage examples:
 
   # Use custom configuration
   python -m doc_parser.utils.batch /input/dir -o /output/dir -c /path/to/config.json
+
+  # Spread files over 4 worker processes
+  python -m doc_parser.utils.batch /input/dir -o /output/dir -j 4
         """
     )
 
@@ -58,14 +88,14 @@ Usage examples:
         help="Recursively process subdirectories"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, process files in this process)"
+    )
 
-    # Initialize client
-    try:
-        client = DocumentParserClient(config_path=args.config)
-    except Exception as e:
-        print(f"Initialization failed: {e}", file=sys.stderr)
-        sys.exit(1)
+    args = parser.parse_args()
 
     input_path = Path(args.input)
     output_path = Path(args.output)
@@ -91,41 +121,81 @@ Usage examples:
     # Process files
     processed_count = 0
     error_count = 0
+    pool_broken = False
 
-    for file_path in files_to_process:
-        try:
-            print(f"Processing: {file_path}")
-            result = client.process_file(file_path)
+    workers = max(1, min(args.workers, len(files_to_process)))
+    chunksize = max(1, min(8, len(files_to_process) // (workers * 4)))
+
+    def handle_outcomes(outcomes):
+        nonlocal processed_count, error_count
+        for file_path, (result, error) in zip(files_to_process, outcomes):
+            if error is not None:
+                print(f"Processing failed {file_path}: {error}", file=sys.stderr)
+                error_count += 1
+                continue
+
+            try:
+                print(f"Processed: {file_path}")
 
-            # Save results
-            save_result(result, output_path, file_path)
+                # Save results
+                save_result(result, output_path, file_path)
 
-            processed_count += 1
+                processed_count += 1
 
+            except Exception as e:
+                print(f"Saving failed {file_path}: {e}", file=sys.stderr)
+                error_count += 1
+
+    if workers == 1:
+        # Sequential: load the configuration and models once, in this process
+        try:
+            # Files run one at a time, so keep the configured page_workers
+            _init_worker(args.config, sequential_pages=False)
         except Exception as e:
-            print(f"Processing failed {file_path}: {e}", file=sys.stderr)
-            error_count += 1
+            print(f"Initialization failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        handle_outcomes(map(_process_one, files_to_process))
+    else:
+        # Each worker process loads the configuration and models once, in _init_worker; spawned
+        # rather than forked so workers start from a clean interpreter
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                     initializer=_init_worker, initargs=(args.config,)) as executor:
+                handle_outcomes(executor.map(_process_one, files_to_process, chunksize=chunksize))
+        except BrokenProcessPool as e:
+            # A worker died (failed initializer, OOM kill, crash): remaining files were not processed
+            print(f"Worker process pool broke: {e}", file=sys.stderr)
+            pool_broken = True
 
     print(f"\nProcessing completed:")
     print(f"  Success: {processed_count}")
     print(f"  Failed: {error_count}")
+    if pool_broken:
+        print(f"  Not processed: {len(files_to_process) - processed_count - error_count}")
     print(f"  Results saved to: {output_path}")
 
+    if pool_broken:
+        sys.exit(1)
+
 
 def collect_files(directory: Path, extensions: List[str], recursive: bool) -> List[Path]:
-    """Collect files to process"""
-    files = []
+    """Collect files to process (single directory walk, extensions matched case-insensitively)"""
+    suffixes = tuple(ext.lower() for ext in extensions)
 
     if recursive:
-        pattern = "**/*"
+        walker = ((root, names) for root, _, names in os.walk(directory))
     else:
-        pattern = "*"
+        with os.scandir(directory) as entries:
+            walker = [(directory, [entry.name for entry in entries if entry.is_file()])]
 
-    for ext in extensions:
-        files.extend(directory.glob(f"{pattern}{ext}"))
-        files.extend(directory.glob(f"{pattern}{ext.upper()}"))
+    files = [
+        Path(root) / name
+        for root, names in walker
+        for name in names
+        if name.lower().endswith(suffixes)
+    ]
 
-    return sorted(list(set(files)))  # Remove duplicates and sort
+    return sorted(files)
 
 
 def save_result(result: dict, output_dir: Path, original_file: Path):
@@ -139,9 +209,7 @@ def save_result(result: dict, output_dir: Path, original_file: Path):
 
     # Save structured JSON
     json_path = output_dir / f"{base_name}_structured.json"
-    import json
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json(json_path, result)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+"""
+JSON output utility
+Serializes results with orjson when available, falling back to the standard library
+"""
+
+import json
+from typing import Any, Union
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def write_json(path: Union[str, Path], data: Any):
+    """Write data as indented UTF-8 JSON in a single write call"""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data))
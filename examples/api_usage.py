@@ -6,8 +6,35 @@ Demonstrates how to use HTTP API for document processing
 
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+
+# requests.Session is not documented as thread-safe, so each thread keeps its own
+# (each with its own pool of keep-alive connections)
+_thread_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Get the calling thread's requests.Session"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
+def get(url):
+    """GET an API endpoint with the calling thread's session"""
+    return get_session().get(url)
+
+
+def post_file(url, filename, data):
+    """Upload file contents (already read into memory) to an API endpoint"""
+    files = {'file': (filename, data, 'application/pdf')}
+    return get_session().post(url, files=files)
+
+
 def main():
     """API usage example"""
 
@@ -20,9 +47,17 @@ def main():
     print("API usage example")
     print(f"Server address: {base_url}")
 
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        run_examples(executor, base_url, sample_file)
+
+
+def run_examples(executor, base_url, sample_file):
+    """Run the API calls, overlapping the independent ones"""
+    session = get_session()
+
     # 1. Health check
     try:
-        response = requests.get(f"{base_url}/health")
+        response = session.get(f"{base_url}/health")
         if response.status_code == 200:
             print("✓ Server running normally")
         else:
@@ -33,20 +68,29 @@ def main():
         print("Run command: python -m doc_parser.api.service")
         return
 
+    # 2-4. Configuration, file processing and text extraction are independent,
+    # so issue them concurrently and print the results in order
+    config_future = executor.submit(get, f"{base_url}/config")
+    process_future = extract_future = None
+    sample_path = Path(sample_file)
+    if sample_path.exists():
+        # Read the sample once and upload the same bytes to both endpoints
+        data = sample_path.read_bytes()
+        process_future = executor.submit(post_file, f"{base_url}/process/file", sample_path.name, data)
+        extract_future = executor.submit(post_file, f"{base_url}/extract/text", sample_path.name, data)
+
     # 2. Get current configuration
     print("\nGet current configuration:")
-    response = requests.get(f"{base_url}/config")
+    response = config_future.result()
     if response.status_code == 200:
         config = response.json()
         print(json.dumps(config, indent=2, ensure_ascii=False))
 
     # 3. Process single file
-    if Path(sample_file).exists():
+    if process_future is not None:
         print(f"\nProcessing file: {sample_file}")
 
-        with open(sample_file, 'rb') as f:
-            files = {'file': (Path(sample_file).name, f, 'application/pdf')}
-            response = requests.post(f"{base_url}/process/file", files=files)
+        response = process_future.result()
 
         if response.status_code == 200:
             result = response.json()
@@ -61,12 +105,10 @@ def main():
             print(f"Processing failed: {response.text}")
 
     # 4. Extract text only
-    if Path(sample_file).exists():
+    if extract_future is not None:
         print("\nExtract text only:")
 
-        with open(sample_file, 'rb') as f:
-            files = {'file': (Path(sample_file).name, f, 'application/pdf')}
-            response = requests.post(f"{base_url}/extract/text", files=files)
+        response = extract_future.result()
 
         if response.status_code == 200:
             result = response.json()
@@ -121,7 +163,7 @@ def main():
         }
     }
 
-    response = requests.put(f"{base_url}/config", json=new_config)
+    response = session.put(f"{base_url}/config", json=new_config)
     if response.status_code == 200:
         print("✓ Configuration updated successfully")
     else:
@@ -129,7 +171,7 @@ def main():
 
     # 6. Get updated configuration
     print("\\nGet updated configuration:")
-    response = requests.get(f"{base_url}/config")
+    response = session.get(f"{base_url}/config")
     if response.status_code == 200:
         config = response.json()
         print("Configuration sections:", list(config.keys()))
@@ -1,64 +1,171 @@
 import json
-import streamlit as st
 from pathlib import Path
 import tempfile
 import os
-import pandas as pd
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 
 # Import from the core modules
-from doc_parser.core.processor import DocumentProcessor
+from doc_parser.core.processor import DocumentProcessor, write_validation_csv
 from doc_parser.core.ocr import OCRConfig
 from doc_parser.core.extractor import ExtractionConfig
 
+# Document processor of a batch worker process, created once by _init_batch_worker
+_batch_processor = None
+
+
+def _init_batch_worker(processor_config):
+    """Executor initializer: build one processor (and its OCR/NLP models) per worker process"""
+    global _batch_processor
+    # Files are already spread across processes, so OCR their pages sequentially
+    _batch_processor = DocumentProcessor(processor_config.model_copy(update={'page_workers': 1}))
+
+
+def _process_batch_file(file_path: Path, threshold: float):
+    """
+    Process one file in a worker process
+
+    Returns:
+        (raw text, structured JSON text, low-confidence CSV rows), or None if processing failed
+    """
+    try:
+        result = _batch_processor.process_file(str(file_path))
+    except Exception as e:
+        print(f"Error processing {file_path}: {e}")
+        return None
+
+    # Serialize here, in parallel, straight from the model without an intermediate dict
+    return result.raw_text, result.model_dump_json(indent=2), result.low_confidence_rows(threshold)
+
+
 # Batch Processing
-def process_batch(folder_path: str, output_dir: str, ocr_config: OCRConfig, extraction_config: ExtractionConfig):
+def process_batch(folder_path: str, output_dir: str, ocr_config: OCRConfig, extraction_config: ExtractionConfig,
+                  workers: int = 1):
+    """
+    Process every image/PDF in a folder, writing raw text, structured JSON and a validation CSV
+
+    Args:
+        folder_path: Input folder
+        output_dir: Output folder
+        ocr_config: OCR configuration
+        extraction_config: Extraction configuration
+        workers: Worker processes to spread files over (1 = sequential in this process)
+    """
+    global _batch_processor
     from doc_parser.core.processor import DocumentProcessorConfig, ValidationConfig
 
-    # Create processor with default validation config
+    # Create processor config with default validation config
     validation_config = ValidationConfig()
     processor_config = DocumentProcessorConfig(ocr=ocr_config, extraction=extraction_config, validation=validation_config)
-    processor = DocumentProcessor(processor_config)
 
     os.makedirs(output_dir, exist_ok=True)
 
-    results = []
-    for file_path in Path(folder_path).glob("*"):
-        if file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.pdf']:
+    files = [file_path for file_path in Path(folder_path).glob("*")
+             if file_path.suffix.lower() in ['.jpg', '.jpeg', '.png', '.pdf']]
+
+    low_conf_rows = []
+    threshold = 80  # Default threshold for batch processing
+    if not files:
+        return
+
+    workers = max(1, min(workers, len(files)))
+    # Outputs are written on I/O threads while the next files are processed
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        writes = []
+        handled = 0
+
+        def handle_outcomes(outcomes):
+            nonlocal handled
+            for file_path, outcome in zip(files, outcomes):
+                handled += 1
+                if outcome is None:
+                    continue
+                raw_text, json_text, rows = outcome
+
+                # Save raw text and structured JSON
+                writes.append((file_path, io_pool.submit(
+                    Path(f"{output_dir}/{file_path.stem}_raw.txt").write_text, raw_text, encoding='utf-8')))
+                writes.append((file_path, io_pool.submit(
+                    Path(f"{output_dir}/{file_path.stem}_structured.json").write_text, json_text, encoding='utf-8')))
+                low_conf_rows.extend(rows)
+
+        if workers == 1:
+            # Sequential: one processor in this process, keeping its configured page_workers
+            _batch_processor = DocumentProcessor(processor_config)
+            handle_outcomes(map(_process_batch_file, files, repeat(threshold)))
+        else:
+            chunksize = max(1, min(4, len(files) // (workers * 4)))
+            # Spawned, not forked: each worker loads its own models instead of inheriting this process's state
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                         initializer=_init_batch_worker, initargs=(processor_config,)) as executor:
+                    handle_outcomes(executor.map(_process_batch_file, files, repeat(threshold), chunksize=chunksize))
+            except BrokenProcessPool as e:
+                # A worker died (failed initializer, OOM kill, crash): keep what finished, report the rest
+                print(f"Worker process pool broke: {e}")
+                print(f"Files handled before the failure: {handled}; not processed: {len(files) - handled}")
+
+        for file_path, write in writes:
             try:
-                result = processor.process_file(str(file_path))
+                write.result()
+            except Exception as e:
+                print(f"Error saving {file_path}: {e}")
 
-                # Save raw text
-                with open(f"{output_dir}/{file_path.stem}_raw.txt", 'w', encoding='utf-8') as f:
-                    f.write(result.raw_text)
+    if low_conf_rows:
+        write_validation_csv(f"{output_dir}/validation_list.csv", low_conf_rows)
 
-                # Save structured JSON
-                with open(f"{output_dir}/{file_path.stem}_structured.json", 'w', encoding='utf-8') as f:
-                    json.dump(result.dict(), f, ensure_ascii=False, indent=2)
+# Streamlit reruns main() on every interaction; main() wraps these helpers in Streamlit caches so
+# config, models and OCR results are reused across reruns (streamlit itself is only imported by the UI)
+def _load_config(path: str, mtime: float = None) -> dict:
+    """Load the JSON config (mtime is part of the cache key, so edits to the file are picked up)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {
+            "ocr": {"engine": "paddle"},
+            "extraction": {"enable_adaptive_fields": True, "fields": []},
+            "validation": {"confidence_threshold": 0.7}
+        }
 
-                results.append(result.dict())
 
-            except Exception as e:
-                print(f"Error processing {file_path}: {e}")
+def _build_processor(config_json: str) -> DocumentProcessor:
+    """Build one DocumentProcessor (OCR engine, spaCy model) per distinct configuration"""
+    from doc_parser.core.processor import DocumentProcessorConfig, ValidationConfig
 
-    # Save validation CSV
-    low_conf_rows = []
-    threshold = 80  # Default threshold for batch processing
-    for res in results:
-        for field in res['extracted_fields']:
-            if field['confidence'] < threshold:
-                low_conf_rows.append({
-                    'filename': res['filename'],
-                    'field_name': field['name'],
-                    'extracted_value': field['value'],
-                    'confidence': field['confidence']
-                })
+    config_data = json.loads(config_json)
+    ocr_config = OCRConfig(**config_data['ocr'])
+    extraction_config = ExtractionConfig(**config_data['extraction'])
+    validation_config = ValidationConfig(**config_data.get('validation', {}))
+
+    processor_config = DocumentProcessorConfig(ocr=ocr_config, extraction=extraction_config, validation=validation_config)
+    return DocumentProcessor(processor_config)
+
+
+def _process_upload(_processor: DocumentProcessor, config_json: str, filename: str, data: bytes):
+    """Process an uploaded file (_processor is not hashed: config_json identifies its configuration)"""
+    # Save uploaded file temporarily, in a fresh directory per upload: the file keeps its name (the result's
+    # filename), but re-uploads never reuse a path, so path-keyed caches (the PDF text probe) cannot
+    # mistake a different file of the same name and size for the previous one
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = os.path.join(temp_dir, os.path.basename(filename))
+        with open(temp_path, "wb") as f:
+            f.write(data)
+
+        return _processor.process_file(temp_path)
 
-    if low_conf_rows:
-        df = pd.DataFrame(low_conf_rows)
-        df.to_csv(f"{output_dir}/validation_list.csv", index=False, encoding='utf-8')
 
 # Streamlit UI
 def main():
+    import streamlit as st
+
+    # Cache keys come from each function's code and arguments, so wrapping on every rerun is cheap
+    load_config = st.cache_data(_load_config)
+    build_processor = st.cache_resource(_build_processor)
+    process_upload = st.cache_data(show_spinner="Processing document...")(_process_upload)
+
     st.title("OCR and Structured Extraction Tool")
 
     # Sidebar for configuration
@@ -72,39 +179,23 @@ def main():
         help="Choose OCR engine. PaddleOCR is the default with excellent quality. Tesseract is fast. Google Vision requires API setup."
     )
 
-    # Load existing config
-    try:
-        with open("config.json", 'r', encoding='utf-8') as f:
-            config_data = json.load(f)
-    except FileNotFoundError:
-        config_data = {
-            "ocr": {"engine": "paddle"},
-            "extraction": {"enable_adaptive_fields": True, "fields": []},
-            "validation": {"confidence_threshold": 0.7}
-        }
-
-    # Create processor with current configuration
-    from doc_parser.core.processor import DocumentProcessorConfig, ValidationConfig
+    # Load existing config (returns a fresh copy, safe to modify)
+    config_path = "config.json"
+    config_mtime = os.path.getmtime(config_path) if os.path.exists(config_path) else None
+    config_data = load_config(config_path, config_mtime)
 
     # Update config with current settings
     config_data['ocr']['engine'] = ocr_engine
 
-    ocr_config = OCRConfig(**config_data['ocr'])
-    extraction_config = ExtractionConfig(**config_data['extraction'])
-    validation_config = ValidationConfig(**config_data.get('validation', {}))
-
-    processor_config = DocumentProcessorConfig(ocr=ocr_config, extraction=extraction_config, validation=validation_config)
-    processor = DocumentProcessor(processor_config)
+    # The serialized configuration keys the cached processor and results
+    config_json = json.dumps(config_data, sort_keys=True)
 
     uploaded_file = st.file_uploader("Upload file", type=['jpg', 'png', 'pdf'])
 
     if uploaded_file:
-        # Save uploaded file temporarily
-        temp_path = f"/tmp/{uploaded_file.name}"
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-
-        result = processor.process_file(temp_path)
+        # Cached per (configuration, file contents); each rerun gets its own copy of the result
+        result = process_upload(build_processor(config_json), config_json, uploaded_file.name,
+                                uploaded_file.getvalue())
 
         st.subheader("Raw Text")
         st.text_area("OCR Result", result.raw_text, height=200)
@@ -2,16 +2,17 @@
 setup.py for doc_parser package
 """
 
-from setuptools import setup, find_packages
-import os
+from pathlib import Path
+from setuptools import setup, find_namespace_packages
+
+HERE = Path(__file__).resolve().parent
 
 # Read README
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+long_description = (HERE / "README.md").read_text(encoding="utf-8")
 
 # Read requirements
-with open("requirements.txt", "r", encoding="utf-8") as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+requirement_lines = (HERE / "requirements.txt").read_text(encoding="utf-8").splitlines()
+requirements = [line.strip() for line in requirement_lines if line.strip() and not line.lstrip().startswith("#")]
 
 setup(
     name="doc-parser",
@@ -22,7 +23,9 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/l236/image_recognization_processing",
-    packages=find_packages(),
+    # doc_parser.core and doc_parser.api have no __init__.py, so plain find_packages() skipped them;
+    # the include list also keeps discovery from walking the rest of the checkout
+    packages=find_namespace_packages(include=["doc_parser", "doc_parser.*"], exclude=["*.__pycache__"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -52,6 +55,12 @@ setup(
         "web": [
             "streamlit",
         ],
+        "perf": [
+            "numba",
+            "orjson",
+            "pypdfium2",
+            "tesserocr",
+        ],
     },
     entry_points={
         "console_scripts": [
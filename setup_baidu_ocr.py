@@ -7,8 +7,32 @@ Helps users configure Baidu Cloud OCR API credentials
 import json
 import os
 import sys
+from importlib import metadata
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def read_config(config_path):
+    """Read config.json (orjson parses the raw bytes when installed)"""
+    if ORJSON_AVAILABLE:
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_config(config_path, config):
+    """Write config.json as indented UTF-8 in a single write"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(config_path, 'wb') as f:
+        f.write(data)
+
 def print_banner():
     """Print setup banner"""
     print("=" * 60)
@@ -19,25 +43,34 @@ def print_banner():
 def check_dependencies():
     """Check if required packages are installed"""
     try:
-        import baidu_aip
-        print("✅ baidu-aip package is installed")
+        # Reads the installed distribution's metadata only, without importing the package
+        version = metadata.version("baidu-aip")
+        print(f"✅ baidu-aip {version} is installed")
         return True
-    except ImportError:
+    except metadata.PackageNotFoundError:
         print("❌ baidu-aip package not found")
         print("   Install with: pip install baidu-aip")
         return False
 
+def read_setting(env_var, prompt):
+    """Read a setting from the environment, prompting only when running interactively"""
+    value = os.environ.get(env_var, "").strip()
+    if not value and sys.stdin.isatty():
+        value = input(prompt).strip()
+    return value
+
 def get_baidu_credentials():
-    """Get Baidu API credentials from user"""
+    """Get Baidu API credentials (BAIDU_APP_ID/BAIDU_API_KEY/BAIDU_SECRET_KEY, else from user)"""
     print("📝 Baidu AI Console Setup:")
     print("   1. Visit: https://ai.baidu.com/")
     print("   2. Create an application")
     print("   3. Get your APP_ID, API_KEY, and SECRET_KEY")
+    print("   (or set BAIDU_APP_ID, BAIDU_API_KEY and BAIDU_SECRET_KEY to skip the prompts)")
     print()
 
-    app_id = input("Enter your Baidu APP_ID: ").strip()
-    api_key = input("Enter your Baidu API_KEY: ").strip()
-    secret_key = input("Enter your Baidu SECRET_KEY: ").strip()
+    app_id = read_setting("BAIDU_APP_ID", "Enter your Baidu APP_ID: ")
+    api_key = read_setting("BAIDU_API_KEY", "Enter your Baidu API_KEY: ")
+    secret_key = read_setting("BAIDU_SECRET_KEY", "Enter your Baidu SECRET_KEY: ")
 
     if not all([app_id, api_key, secret_key]):
         print("❌ All credentials are required!")
@@ -52,11 +85,12 @@ def get_baidu_credentials():
 def test_baidu_connection(credentials):
     """Test Baidu OCR API connection"""
     try:
-        from aip import AipOcr
+        from doc_parser.core.baidu_client import get_baidu_client
 
         print("🔍 Testing Baidu OCR connection...")
 
-        client = AipOcr(credentials["app_id"], credentials["api_key"], credentials["secret_key"])
+        # Same pooled client the OCR engine uses
+        client = get_baidu_client(credentials["app_id"], credentials["api_key"], credentials["secret_key"])
 
         # Test with a simple API call (this should not consume quota)
         # We'll just check if the client initializes properly
@@ -78,8 +112,7 @@ def update_config_file(credentials):
     # Load existing config or create default
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = read_config(config_path)
         except Exception as e:
             print(f"⚠️  Could not read existing config.json: {e}")
             config = {}
@@ -98,8 +131,7 @@ def update_config_file(credentials):
 
     # Save config
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        write_config(config_path, config)
 
         print(f"✅ Configuration saved to {config_path}")
         return True
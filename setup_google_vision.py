@@ -3,35 +3,70 @@
 Google Vision API Setup Guide for Chinese Document Processing
 """
 
-import os
 import json
+import os
+import shutil
 import subprocess
+import sys
+import time
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Marker file recording that the Vision API was found enabled, trusted for VISION_API_CHECK_TTL seconds
+VISION_API_CHECK_CACHE = Path.home() / ".cache" / "doc_parser" / "gvision_api.ok"
+VISION_API_CHECK_TTL = 3600
+
+def read_config(config_path):
+    """Read config.json (orjson parses the raw bytes when installed)"""
+    if ORJSON_AVAILABLE:
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_config(config_path, config):
+    """Write config.json as indented UTF-8 in a single write"""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(config_path, 'wb') as f:
+        f.write(data)
+
 def check_gcloud_installation():
     """Check if Google Cloud SDK is installed"""
-    try:
-        result = subprocess.run(['gcloud', '--version'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Google Cloud SDK is installed")
-            return True
-        else:
-            print("❌ Google Cloud SDK not found")
-            return False
-    except FileNotFoundError:
+    # A PATH lookup is enough here; running `gcloud --version` would cold-start the SDK
+    gcloud_path = shutil.which('gcloud')
+    if gcloud_path:
+        print(f"✅ Google Cloud SDK is installed ({gcloud_path})")
+        return True
+    else:
         print("❌ Google Cloud SDK not found")
         return False
 
 def check_google_vision_api():
-    """Check if Google Vision API is enabled"""
+    """Check if Google Vision API is enabled (a positive answer is cached for VISION_API_CHECK_TTL)"""
     try:
+        if (VISION_API_CHECK_CACHE.exists()
+                and time.time() - VISION_API_CHECK_CACHE.stat().st_mtime < VISION_API_CHECK_TTL):
+            print("✅ Google Vision API is enabled (checked recently)")
+            return True
+
         result = subprocess.run([
             'gcloud', 'services', 'list', '--enabled',
-            '--filter=name:vision.googleapis.com'
+            '--filter=name:vision.googleapis.com', '--format=value(name)'
         ], capture_output=True, text=True)
 
-        if 'vision.googleapis.com' in result.stdout:
+        if any(line.strip().endswith('vision.googleapis.com') for line in result.stdout.splitlines()):
             print("✅ Google Vision API is enabled")
+            # gcloud takes seconds to start: remember the answer for repeated setup runs
+            VISION_API_CHECK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            VISION_API_CHECK_CACHE.touch()
             return True
         else:
             print("❌ Google Vision API is not enabled")
@@ -48,53 +83,80 @@ def create_service_account():
     account_name = "doc-parser-vision"
     display_name = "Document Parser Vision API"
 
-    print("Run these commands in your terminal:")
-    print()
-    print("# 1. Create service account")
-    print(f'gcloud iam service-accounts create {account_name} \\')
-    print(f'    --display-name "{display_name}"')
+    # One paste-able script: steps 2 and 3 only depend on step 1, so they run concurrently
+    print("Run this script in your terminal:")
     print()
-    print("# 2. Grant Vision API access")
-    print(f'gcloud projects add-iam-policy-binding YOUR_PROJECT_ID \\')
-    print(f'    --member="serviceAccount:{account_name}@YOUR_PROJECT_ID.iam.gserviceaccount.com" \\')
-    print('    --role="roles/editor"')
+    print('PROJECT_ID="$(gcloud config get-value project)"')
+    print(f'SA="{account_name}@${{PROJECT_ID}}.iam.gserviceaccount.com"')
     print()
-    print("# 3. Generate credentials key")
-    print(f'gcloud iam service-accounts keys create credentials.json \\')
-    print(f'    --iam-account={account_name}@YOUR_PROJECT_ID.iam.gserviceaccount.com')
+    print("# 1. Create service account")
+    print(f'gcloud iam service-accounts create {account_name} --display-name "{display_name}" --quiet && {{')
+    print("  # 2. Grant Vision API access")
+    print('  gcloud projects add-iam-policy-binding "$PROJECT_ID" --member="serviceAccount:$SA" \\')
+    print('      --role="roles/editor" --quiet >/dev/null &')
+    print("  # 3. Generate credentials key")
+    print('  gcloud iam service-accounts keys create credentials.json --iam-account="$SA" --quiet &')
+    print("  wait")
+    print("}")
     print()
     print("📁 Save the credentials.json file in your project directory")
 
 def setup_credentials():
-    """Set up credentials environment variable"""
+    """
+    Set up credentials environment variable
+
+    Returns:
+        The validated credentials path, or None if validation failed
+    """
     print("\n🔐 Setting up Credentials")
     print("=" * 40)
 
-    credentials_path = input("Enter the full path to your credentials.json file: ").strip()
+    # An exported GOOGLE_APPLICATION_CREDENTIALS skips the prompt (and allows non-interactive runs)
+    credentials_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '').strip()
+    if credentials_path:
+        print(f"Using GOOGLE_APPLICATION_CREDENTIALS: {credentials_path}")
+    elif sys.stdin.isatty():
+        credentials_path = input("Enter the full path to your credentials.json file: ").strip()
+
+    if not credentials_path:
+        print("❌ No credentials path given (set GOOGLE_APPLICATION_CREDENTIALS)")
+        return None
 
     if not Path(credentials_path).exists():
         print(f"❌ Credentials file not found: {credentials_path}")
-        return False
+        return None
 
     # Test credentials
     os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
 
+    # Imported here, not at module scope: doc_parser pulls in PIL, numpy, OpenCV and pydantic, while
+    # the checks before this step must work before those are installed
+    try:
+        from google.cloud import vision  # noqa: F401
+    except ImportError:
+        print("❌ google-cloud-vision not installed. Install with: pip install google-cloud-vision")
+        return None
     try:
-        from google.cloud import vision
-        client = vision.ImageAnnotatorClient()
+        from doc_parser.core.vision_client import get_vision_client
+    except ImportError as e:
+        print(f"❌ Document parser dependencies not installed ({e}). Install with: pip install -r requirements.txt")
+        return None
+
+    try:
+        # Created once and shared with the OCR engine used by test_google_vision_ocr
+        get_vision_client(credentials_path)
         print("✅ Google Vision API credentials are valid!")
-        return True
+        return credentials_path
     except Exception as e:
         print(f"❌ Credentials validation failed: {e}")
-        return False
+        return None
 
 def update_config_for_google_vision(credentials_path):
     """Update config.json to use Google Vision"""
     config_path = 'config.json'
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = read_config(config_path)
 
         # Update OCR configuration
         config['ocr'] = {
@@ -103,8 +165,7 @@ def update_config_for_google_vision(credentials_path):
         }
 
         # Save updated config
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        write_config(config_path, config)
 
         print(f"✅ Updated {config_path} to use Google Vision API")
         return True
@@ -113,8 +174,8 @@ def update_config_for_google_vision(credentials_path):
         print(f"❌ Failed to update config: {e}")
         return False
 
-def test_google_vision_ocr():
-    """Test Google Vision OCR with Chinese contract"""
+def test_google_vision_ocr(credentials_path):
+    """Test Google Vision OCR with Chinese contract, reusing the client validated by setup_credentials"""
     print("\n🧪 Testing Google Vision OCR")
     print("=" * 40)
 
@@ -124,18 +185,20 @@ def test_google_vision_ocr():
         # Test with Google Vision
         config = OCRConfig(
             engine="google_vision",
-            google_credentials_path=os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+            google_credentials_path=credentials_path
         )
 
         ocr_engine = OCREngine(config)
 
-        # Convert first page of Chinese contract to test
-        import pdf2image
-        images = pdf2image.convert_from_path('test_files/李康佳合同.pdf', first_page=1, last_page=1)
-        images[0].save('temp_test_page.png')
+        # Render the first page of the Chinese contract as JPEG straight to stdout: no temp
+        # directory, no PPM intermediate, and the bytes go to Vision without a PIL round-trip
+        page = subprocess.run([
+            'pdftocairo', '-jpeg', '-jpegopt', 'quality=92', '-r', '200',
+            '-f', '1', '-l', '1', '-singlefile', 'test_files/李康佳合同.pdf', '-'
+        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True).stdout
 
         print("Processing Chinese contract with Google Vision...")
-        result = ocr_engine.recognize('temp_test_page.png')
+        result = ocr_engine.recognize(page)
 
         print(f"✅ Success! OCR Confidence: {result['confidence']:.1f}%")
         print(f"Text Length: {len(result['text'])} characters")
@@ -143,10 +206,6 @@ def test_google_vision_ocr():
         print("Sample extracted text:")
         print(repr(result['text'][:300]))
 
-        # Clean up
-        import os
-        os.remove('temp_test_page.png')
-
         if result['confidence'] > 50:
             print("\n🎉 Google Vision OCR is working excellently!")
             return True
@@ -181,13 +240,12 @@ def main():
         return
 
     # Set up credentials
-    if setup_credentials():
-        credentials_path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
-
+    credentials_path = setup_credentials()
+    if credentials_path:
         # Update configuration
         if update_config_for_google_vision(credentials_path):
-            # Test the setup
-            if test_google_vision_ocr():
+            # Test the setup (same credentials path, so the same cached client)
+            if test_google_vision_ocr(credentials_path):
                 print("\n" + "=" * 70)
                 print("🎉 SUCCESS! Google Vision API is ready for Chinese contracts")
                 print()
@@ -4,15 +4,21 @@ spaCy Model Setup Script
 Helps download and verify spaCy models required for document processing
 """
 
+import functools
 import subprocess
 import sys
 import os
+from importlib import metadata
+
+# Components skipped when checking that a model loads: they hold most of the weights
+MODEL_CHECK_EXCLUDED_PIPES = ["tagger", "parser", "ner"]
 
 def run_command(cmd, description):
-    """Run a command and return success status"""
+    """Run a command (argv list, no shell) and return success status"""
     print(f"\n🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
+        # stdout is discarded rather than buffered; stderr is only kept for the error report
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         print(f"✅ {description} completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -23,24 +29,30 @@ def run_command(cmd, description):
 def check_spacy_installation():
     """Check if spaCy is installed"""
     try:
-        import spacy
-        version = spacy.__version__
+        # Reads the installed distribution's metadata only: importing spaCy would load thinc and numpy
+        version = metadata.version("spacy")
         print(f"✅ spaCy {version} is installed")
         return True
-    except ImportError:
+    except metadata.PackageNotFoundError:
         print("❌ spaCy is not installed")
         return False
 
 def download_model(model_name, description):
     """Download a spaCy model"""
-    cmd = f"python -m spacy download {model_name}"
+    cmd = [sys.executable, "-m", "spacy", "download", model_name]
     return run_command(cmd, f"Downloading {description} ({model_name})")
 
+@functools.lru_cache(maxsize=None)
+def load_model(model_name):
+    """Load a spaCy model once, without its heaviest components"""
+    # Imported here: spaCy may only have been installed by main()
+    import spacy
+    return spacy.load(model_name, exclude=MODEL_CHECK_EXCLUDED_PIPES)
+
 def test_model(model_name, description):
     """Test if a spaCy model can be loaded"""
     try:
-        import spacy
-        nlp = spacy.load(model_name)
+        load_model(model_name)
         print(f"✅ {description} loaded successfully")
         return True
     except Exception as e:
@@ -55,7 +67,7 @@ def main():
     # Check spaCy installation
     if not check_spacy_installation():
         print("\n📦 Installing spaCy...")
-        if not run_command("pip install spacy==3.7.2", "Installing spaCy"):
+        if not run_command([sys.executable, "-m", "pip", "install", "spacy==3.7.2"], "Installing spaCy"):
             print("❌ Failed to install spaCy. Please install manually: pip install spacy==3.7.2")
             sys.exit(1)
 
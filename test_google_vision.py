@@ -4,9 +4,15 @@ Simple Google Vision API Test
 Test Google Vision setup without requiring gcloud SDK
 """
 
+import io
 import os
 import sys
 
+from PIL import Image, ImageDraw, ImageFont
+
+# Loaded once, outside the timed API check
+_FONT = ImageFont.load_default()
+
 def test_google_vision_setup():
     """Test Google Vision API setup"""
     print("🧪 Testing Google Vision API Setup")
@@ -29,25 +35,35 @@ def test_google_vision_setup():
 
     print(f"✅ Found credentials file: {credentials_path}")
 
-    # Test Google Vision API
+    # Import the Vision SDK and the shared client helper separately, so each failure is reported accurately
     try:
         from google.cloud import vision
-        import io
+    except ImportError:
+        print("❌ google-cloud-vision package not installed")
+        print("\n📦 Install with:")
+        print("pip install google-cloud-vision")
+        return False
 
-        print("🔄 Initializing Google Vision client...")
-        client = vision.ImageAnnotatorClient()
+    try:
+        from doc_parser.core.vision_client import get_vision_client
+    except ImportError as e:
+        print(f"❌ Document parser dependencies not installed: {e}")
+        print("\n📦 Install with:")
+        print("pip install -r requirements.txt")
+        return False
 
-        # Create a simple test image (small white square with text)
-        from PIL import Image, ImageDraw, ImageFont
+    # Test Google Vision API
+    try:
+        print("🔄 Initializing Google Vision client...")
+        client = get_vision_client(credentials_path)
 
-        # Create a small test image
+        # Create a small test image (white strip with text)
         img = Image.new('RGB', (200, 50), color='white')
         draw = ImageDraw.Draw(img)
 
         # Try to add some text (English for testing)
         try:
-            # Use default font
-            draw.text((10, 15), "Test OCR", fill='black')
+            draw.text((10, 15), "Test OCR", fill='black', font=_FONT)
         except:
             # Fallback if font fails
             pass
@@ -60,7 +76,8 @@ def test_google_vision_setup():
         # Test API call
         print("🔄 Testing API call...")
         image = vision.Image(content=img_byte_arr)
-        response = client.text_detection(image=image)
+        # Text detection only, with the languages the parser uses instead of auto-detection
+        response = client.text_detection(image=image, image_context={'language_hints': ['zh', 'en']})
 
         if response.text_annotations:
             detected_text = response.text_annotations[0].description.strip()
@@ -72,12 +89,6 @@ def test_google_vision_setup():
             print("🎉 Google Vision API connection is working!")
             return True
 
-    except ImportError:
-        print("❌ google-cloud-vision package not installed")
-        print("\n📦 Install with:")
-        print("pip install google-cloud-vision")
-        return False
-
     except Exception as e:
         print(f"❌ Google Vision API test failed: {e}")
         print("\n🔧 Troubleshooting:")